@@ -1,4 +1,9 @@
 import sys
+from pathlib import Path
+
+# Moteur de tournoi (partition, appariement...) à la racine du dépôt
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
 from ui.main_window import MainWindow
 from PySide6.QtWidgets import QApplication, QStyleFactory
 
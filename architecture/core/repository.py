@@ -0,0 +1,212 @@
+import heapq
+from bisect import bisect_left, insort
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.tournament import Tournament
+
+
+def date_key(date: str) -> Tuple[int, int, int]:
+    """JJ/MM/AAAA -> (AAAA, MM, JJ), triable ; (0, 0, 0) si illisible."""
+    try:
+        day, month, year = (int(part) for part in date.split("/"))
+    except ValueError:
+        return (0, 0, 0)
+    return (year, month, day)
+
+
+class TournamentRepository:
+    """
+    Propriétaire unique des tournois de l'application (hors UI).
+
+    - ids : le plus petit id libre, via un tas des trous laissés par les
+      suppressions (plus de tri de tous les ids à chaque création) ;
+      le set des ids libres permet de retirer un id du tas paresseusement
+    - index par id, par date (liste triée) et par format
+    - les vues s'abonnent aux changements au lieu de garder leurs copies
+
+    Persistance optionnelle : `autosave` (mark_dirty / mark_deleted).
+    """
+
+    def __init__(self, autosave=None):
+        self._autosave = autosave
+
+        self._by_id: Dict[int, Tournament] = {}
+        self._by_date: List[Tuple[Tuple[int, int, int], int]] = []
+        self._by_format: Dict[str, set] = {}
+        # id -> (clé de date, format) sous lesquels le tournoi est indexé
+        self._indexed: Dict[int, Tuple[Tuple[int, int, int], str]] = {}
+
+        self._next_id = 1
+        self._free_ids: List[int] = []
+        self._free_set: set = set()
+
+        self._listeners: List[Callable[[str, Tournament], None]] = []
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, tournament_id: int) -> bool:
+        return tournament_id in self._by_id
+
+    # =====================
+    # Chargement
+    # =====================
+
+    def load(self, summaries: Iterable[Dict], loader: Callable[[int], Dict]):
+        """Remplit le dépôt depuis les résumés du stockage (joueurs chargés plus tard)."""
+        for summary in summaries:
+            self._index(Tournament.from_summary(summary, loader))
+
+        used = set(self._by_id)
+        self._next_id = max(used, default=0) + 1
+        self._free_ids = [i for i in range(1, self._next_id) if i not in used]
+        self._free_set = set(self._free_ids)
+        heapq.heapify(self._free_ids)
+
+    # =====================
+    # Ids
+    # =====================
+
+    def allocate_id(self) -> int:
+        """Plus petit id libre (le trou le plus bas, sinon le suivant)."""
+        while self._free_ids:
+            tournament_id = heapq.heappop(self._free_ids)
+            # Entrée périmée : id repris entre-temps par add()
+            if tournament_id in self._free_set:
+                self._free_set.remove(tournament_id)
+                return tournament_id
+
+        tournament_id = self._next_id
+        self._next_id += 1
+        return tournament_id
+
+    def release_id(self, tournament_id: int):
+        """Rend un id alloué mais jamais utilisé (création annulée)."""
+        if tournament_id not in self._by_id:
+            self._free(tournament_id)
+
+    def _free(self, tournament_id: int):
+        if tournament_id not in self._free_set:
+            self._free_set.add(tournament_id)
+            heapq.heappush(self._free_ids, tournament_id)
+
+    # =====================
+    # Mutations
+    # =====================
+
+    def add(self, tournament: Tournament):
+        if tournament.id in self._by_id:
+            raise ValueError(f"Id de tournoi déjà utilisé : {tournament.id}")
+
+        # Id choisi hors de allocate_id() : on le retire des ids libres
+        if tournament.id >= self._next_id:
+            for free in range(self._next_id, tournament.id):
+                self._free(free)
+            self._next_id = tournament.id + 1
+        else:
+            self._free_set.discard(tournament.id)
+
+        self._index(tournament)
+        self._save(tournament)
+        self._notify("added", tournament)
+
+    def update(self, tournament: Tournament):
+        """À appeler après modification (date et format sont réindexés)."""
+        self._unindex(tournament.id)
+        self._index(tournament)
+        self._save(tournament)
+        self._notify("updated", tournament)
+
+    def remove(self, tournament_id: int) -> Optional[Tournament]:
+        tournament = self._by_id.get(tournament_id)
+        if tournament is None:
+            return None
+
+        self._unindex(tournament_id)
+        del self._by_id[tournament_id]
+        self._free(tournament_id)
+
+        if self._autosave is not None:
+            self._autosave.mark_deleted(tournament_id)
+        self._notify("removed", tournament)
+        return tournament
+
+    # =====================
+    # Requêtes
+    # =====================
+
+    def get(self, tournament_id: int) -> Optional[Tournament]:
+        return self._by_id.get(tournament_id)
+
+    def all(self) -> List[Tournament]:
+        """Tous les tournois, dans l'ordre d'ajout."""
+        return list(self._by_id.values())
+
+    def by_date(self, reverse: bool = False) -> List[Tournament]:
+        ids = (tid for _, tid in (reversed(self._by_date) if reverse else self._by_date))
+        return [self._by_id[tid] for tid in ids]
+
+    def between(self, start: str, end: str) -> List[Tournament]:
+        """Tournois entre deux dates JJ/MM/AAAA incluses, triés par date."""
+        lo = bisect_left(self._by_date, (date_key(start), 0))
+        hi = bisect_left(self._by_date, (date_key(end), float("inf")))
+        return [self._by_id[tid] for _, tid in self._by_date[lo:hi]]
+
+    def upcoming(self, today: str) -> List[Tournament]:
+        """À partir de `today` inclus, du plus proche au plus lointain."""
+        lo = bisect_left(self._by_date, (date_key(today), 0))
+        return [self._by_id[tid] for _, tid in self._by_date[lo:]]
+
+    def past(self, today: str) -> List[Tournament]:
+        """Avant `today`, du plus récent au plus ancien (historique)."""
+        hi = bisect_left(self._by_date, (date_key(today), 0))
+        return [self._by_id[tid] for _, tid in reversed(self._by_date[:hi])]
+
+    def by_format(self, fmt: str) -> List[Tournament]:
+        ids = self._by_format.get(fmt, ())
+        return sorted(
+            (self._by_id[tid] for tid in ids),
+            key=lambda t: self._indexed[t.id],
+        )
+
+    # =====================
+    # Abonnements
+    # =====================
+
+    def add_listener(self, listener: Callable[[str, Tournament], None]):
+        """listener(événement, tournoi), événement = "added" / "updated" / "removed"."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, Tournament], None]):
+        self._listeners.remove(listener)
+
+    def _notify(self, event: str, tournament: Tournament):
+        for listener in list(self._listeners):
+            listener(event, tournament)
+
+    # =====================
+    # Index
+    # =====================
+
+    def _index(self, tournament: Tournament):
+        tid = tournament.id
+        key = date_key(tournament.date)
+
+        self._by_id[tid] = tournament
+        insort(self._by_date, (key, tid))
+        self._by_format.setdefault(tournament.format, set()).add(tid)
+        self._indexed[tid] = (key, tournament.format)
+
+    def _unindex(self, tournament_id: int):
+        key, fmt = self._indexed.pop(tournament_id)
+
+        del self._by_date[bisect_left(self._by_date, (key, tournament_id))]
+
+        ids = self._by_format[fmt]
+        ids.discard(tournament_id)
+        if not ids:
+            del self._by_format[fmt]
+
+    def _save(self, tournament: Tournament):
+        if self._autosave is not None:
+            self._autosave.mark_dirty(tournament)
@@ -1,5 +1,37 @@
+import csv
+import json
 from dataclasses import dataclass, field
-from typing import List, Dict
+from typing import Callable, Iterable, List, Dict, Optional, Tuple, Union
+
+from partition import DEFAULT_SIZES, table_count
+
+
+# Tailles de tables par format (pods de 3 / 4 par défaut)
+TABLE_SIZES_BY_FORMAT = {
+    "⚔️ Duel Commander": (2,),
+}
+
+# Formats où un joueur peut être exempté (bye) si le compte ne tombe pas juste
+BYE_FORMATS = {"⚔️ Duel Commander"}
+
+# Champs sérialisés dont on suit les modifications
+TRACKED_FIELDS = ("name", "format", "date", "players")
+
+
+@dataclass
+class RosterImport:
+    """Bilan d'un import de joueurs en masse."""
+    added: List[str] = field(default_factory=list)
+    # (nom tel que lu, raison)
+    rejected: List[Tuple[str, str]] = field(default_factory=list)
+
+
+# Attribut pas encore défini (construction du dataclass)
+_UNSET = object()
+
+
+def _name_key(name: str) -> str:
+    return name.casefold()
 
 
 @dataclass
@@ -11,42 +43,208 @@ class Tournament:
 
     players: List[str] = field(default_factory=list)
 
+    # Chargement différé : seul le résumé est lu au démarrage,
+    # la liste des joueurs vient de _loader(id) au premier besoin
+    _player_count: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _loader: Optional[Callable[[int], Dict]] = field(default=None, init=False, repr=False, compare=False)
+
+    # Suivi des modifications : champs changés depuis la dernière écriture,
+    # compteur de versions et forme encodée en cache
+    _changes: set = field(default_factory=set, init=False, repr=False, compare=False)
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    # (version encodée, bytes) : un cache d'une version dépassée n'est jamais servi
+    _encoded: Optional[Tuple[int, bytes]] = field(default=None, init=False, repr=False, compare=False)
+
+    # Index des noms sans casse : clé casefold -> nom inscrit
+    _names: Dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._reindex()
+        # Un tournoi neuf n'a encore jamais été écrit
+        self._changes.update(TRACKED_FIELDS)
+
+    def __setattr__(self, name, value):
+        old = self.__dict__.get(name, _UNSET)
+        object.__setattr__(self, name, value)
+
+        # Même valeur réassignée (ex. dialogue validé sans modification) :
+        # rien à suivre. Une liste modifiée sur place puis réassignée compte.
+        if old == value and not (old is value and isinstance(value, list)):
+            return
+
+        if name == "players" and "_names" in self.__dict__:
+            self._reindex()
+        if name in TRACKED_FIELDS and "_changes" in self.__dict__:
+            self._touch(name)
+
+    def _reindex(self):
+        self._names = {_name_key(p): p for p in self.players}
+
+    def _touch(self, name: str):
+        self._changes.add(name)
+        self._version += 1
+        self._encoded = None
+
+    # =====================
+    # Dirty tracking
+    # =====================
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._changes)
+
+    @property
+    def changed_fields(self) -> set:
+        return set(self._changes)
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def mark_clean(self, version: Optional[int] = None):
+        """
+        Après écriture. Avec `version`, ne fait rien si le tournoi
+        a encore changé depuis (écriture faite depuis un autre thread).
+        """
+        if version is None or version == self._version:
+            self._changes.clear()
+
     # =====================
     # Business logic
     # =====================
 
+    @property
+    def loaded(self) -> bool:
+        return self._loader is None
+
+    def ensure_loaded(self):
+        if self._loader is None:
+            return
+        data = self._loader(self.id) or {}
+        # Relu depuis le stockage : pas une modification
+        object.__setattr__(self, "players", list(data.get("players", [])))
+        self._reindex()
+        self._encoded = None
+        self._loader = None
+        self._player_count = None
+
     def add_player(self, name: str) -> bool:
+        self.ensure_loaded()
         name = name.strip()
         if not name:
             return False
 
         # Empêcher les doublons (case-insensitive)
-        if name.lower() in (p.lower() for p in self.players):
+        key = _name_key(name)
+        if key in self._names:
             return False
 
+        self._names[key] = name
         self.players.append(name)
+        self._touch("players")
         return True
 
+    def add_players(self, rows: Union[str, Iterable[str]], from_csv: bool = False) -> RosterImport:
+        """
+        Inscrit une liste de joueurs en un passage : texte collé ou lignes,
+        un nom par ligne (les virgules font partie du nom). Avec from_csv,
+        les lignes sont lues comme un CSV, nom en première colonne.
+        Les lignes vides, doublons et joueurs déjà inscrits sont rejetés.
+        """
+        self.ensure_loaded()
+        report = RosterImport()
+        imported = set()
+
+        if isinstance(rows, str):
+            rows = rows.splitlines()
+        if from_csv:
+            rows = (row[0] if row else "" for row in csv.reader(rows))
+
+        for raw in rows:
+            raw = raw.rstrip("\r\n")
+            name = raw.strip()
+            if not name:
+                if raw:
+                    report.rejected.append((raw, "nom vide"))
+                continue
+
+            key = _name_key(name)
+            if key in self._names:
+                reason = "doublon dans l'import" if key in imported else "déjà inscrit"
+                report.rejected.append((name, reason))
+                continue
+
+            self._names[key] = name
+            imported.add(key)
+            self.players.append(name)
+            report.added.append(name)
+
+        if report.added:
+            self._touch("players")
+        return report
+
     def remove_player(self, name: str):
-        self.players = [
-            p for p in self.players
-            if p.lower() != name.lower()
-        ]
+        self.ensure_loaded()
+        registered = self._names.pop(_name_key(name.strip()), None)
+        if registered is None:
+            return
+
+        self.players.remove(registered)
+        self._touch("players")
+
+    def has_player(self, name: str) -> bool:
+        self.ensure_loaded()
+        return _name_key(name.strip()) in self._names
 
     @property
     def player_count(self) -> int:
+        if self._player_count is not None:
+            return self._player_count
         return len(self.players)
 
-    def table_count(self, seats_per_table: int = 4) -> int:
-        if self.player_count == 0:
-            return 0
-        return max(1, self.player_count // seats_per_table)
+    @property
+    def table_sizes(self) -> tuple:
+        return TABLE_SIZES_BY_FORMAT.get(self.format, DEFAULT_SIZES)
+
+    def table_count(self) -> int:
+        # Même solveur que le tirage réel : l'aperçu ne peut pas diverger
+        return table_count(
+            self.player_count,
+            self.table_sizes,
+            byes=self.format in BYE_FORMATS,
+        )
 
     # =====================
     # Serialization
     # =====================
 
+    def to_bytes(self) -> bytes:
+        """to_dict() encodé en JSON, gardé en cache tant que rien ne change."""
+        return self.snapshot()[2]
+
+    def snapshot(self) -> Tuple[int, Dict, bytes]:
+        """
+        (version, enregistrement, JSON encodé) pris ensemble : l'autosave
+        écrit et indexe le même état, encodé une seule fois. Si le tournoi
+        change pendant la copie, rien n'est mis en cache et la version
+        rendue est l'ancienne (mark_clean ne fera rien, une écriture suivra).
+        """
+        version = self._version
+        record = self.to_dict()
+        record["players"] = list(record["players"])
+
+        cached = self._encoded
+        if cached is not None and cached[0] == version and self._version == version:
+            return version, record, cached[1]
+
+        encoded = json.dumps(record, ensure_ascii=False).encode("utf-8")
+        if self._version == version:
+            self._encoded = (version, encoded)
+        return version, record, encoded
+
     def to_dict(self) -> Dict:
+        # Jamais de liste de joueurs vide par oubli du chargement
+        self.ensure_loaded()
         return {
             "id": self.id,
             "name": self.name,
@@ -57,10 +255,26 @@ class Tournament:
 
     @classmethod
     def from_dict(cls, data: Dict) -> "Tournament":
-        return cls(
+        tournament = cls(
             id=data["id"],
             name=data["name"],
             format=data["format"],
             date=data["date"],
             players=data.get("players", []),
         )
+        tournament.mark_clean()
+        return tournament
+
+    @classmethod
+    def from_summary(cls, summary: Dict, loader: Callable[[int], Dict]) -> "Tournament":
+        """Tournoi à partir de son résumé d'index ; joueurs chargés plus tard."""
+        tournament = cls(
+            id=summary["id"],
+            name=summary["name"],
+            format=summary["format"],
+            date=summary["date"],
+        )
+        tournament._player_count = summary.get("player_count", 0)
+        tournament._loader = loader
+        tournament.mark_clean()
+        return tournament
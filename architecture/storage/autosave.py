@@ -0,0 +1,117 @@
+import threading
+import time
+import traceback
+
+
+# Délai sans nouvelle modification avant d'écrire (secondes)
+DEFAULT_DELAY = 0.5
+
+
+class AutosaveService:
+    """
+    Sauvegarde différée, hors du thread de l'interface.
+
+    Les vues marquent les objets modifiés (mark_dirty / mark_deleted) ;
+    une rafale de modifications sur le même objet ne donne qu'une
+    écriture, faite par un thread de fond une fois le calme revenu.
+    La sérialisation (to_dict) et les accès disque se font dans ce thread.
+
+    close() (à brancher sur QApplication.aboutToQuit) écrit ce qui reste.
+    """
+
+    def __init__(self, storage, delay: float = DEFAULT_DELAY):
+        self.storage = storage
+        self.delay = delay
+
+        # clé -> objet à écrire, ou None pour une suppression
+        self._pending = {}
+        self._deadline = None
+        self._closed = False
+
+        self._cond = threading.Condition()
+        # Une seule écriture à la fois, dans l'ordre des lots
+        self._write_lock = threading.Lock()
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    # =====================
+    # Marquage
+    # =====================
+
+    def mark_dirty(self, obj):
+        self._mark(obj.id, obj)
+
+    def mark_deleted(self, key):
+        self._mark(key, None)
+
+    def _mark(self, key, obj):
+        with self._cond:
+            self._pending[key] = obj
+            self._deadline = time.monotonic() + self.delay
+            self._cond.notify()
+
+    # =====================
+    # Écriture
+    # =====================
+
+    def flush(self):
+        """Écrit immédiatement tout ce qui est en attente (appel bloquant)."""
+        with self._write_lock:
+            with self._cond:
+                batch = self._pending
+                self._pending = {}
+                self._deadline = None
+
+            try:
+                for key, obj in batch.items():
+                    if obj is None:
+                        self.storage.delete(key)
+                    else:
+                        self._write(obj)
+            except Exception:
+                # On garde le lot pour la prochaine tentative
+                with self._cond:
+                    for key, obj in batch.items():
+                        self._pending.setdefault(key, obj)
+                raise
+
+    def _write(self, obj):
+        # Rien n'a changé depuis la dernière écriture : rien à faire
+        if not obj.dirty:
+            return
+
+        # Un seul instantané : même état dans le journal et dans l'index
+        version, record, encoded = obj.snapshot()
+        self.storage.put(record, encoded=encoded)
+        obj.mark_clean(version)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self.flush()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if self._deadline is None:
+                        self._cond.wait()
+                        continue
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                if self._closed:
+                    return
+
+            try:
+                self.flush()
+            except Exception:
+                traceback.print_exc()
+                # Nouvel essai après le délai
+                with self._cond:
+                    self._deadline = time.monotonic() + self.delay
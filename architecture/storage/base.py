@@ -1,30 +1,249 @@
 import json
+import os
+import threading
 from pathlib import Path
 
 
 DATA_DIR = Path("data")
 
+# Nombre d'entrées de journal avant de les replier dans le snapshot
+COMPACT_EVERY = 200
+
 
 class JsonStorage:
+    """
+    Snapshot JSON (liste d'enregistrements) + journal en ajout seul.
+
+    Chaque modification (put / delete) ajoute une ligne au journal ;
+    load() relit le snapshot puis rejoue le journal. Au-delà de
+    COMPACT_EVERY entrées, le tout est réécrit dans le snapshot.
+
+    Les écritures du snapshot passent par un fichier temporaire renommé
+    (os.replace) : un crash laisse l'ancien fichier intact. Une ligne de
+    journal tronquée par un crash est retirée à la relecture.
+
+    Le snapshot reste une liste JSON, à un enregistrement par ligne. Un
+    index (<fichier>.index) garde le résumé de chaque enregistrement et
+    la position de sa ligne : load_index() ne lit que les résumés,
+    load_one() ne décode qu'un seul enregistrement.
+    """
+
     filename: str  # à définir dans les subclasses
+    key = "id"
+
+    _journal_entries = 0
+
+    # Remplis par load_index() : positions dans le snapshot,
+    # enregistrements plus récents que le snapshot (journal)
+    _offsets = None
+    _recent = None
+
+    # L'autosave écrit depuis un thread de fond
+    _lock = threading.RLock()
 
     @classmethod
     def _file(cls) -> Path:
         return DATA_DIR / cls.filename
 
+    @classmethod
+    def _journal(cls) -> Path:
+        return DATA_DIR / f"{cls.filename}.journal"
+
+    @classmethod
+    def _index(cls) -> Path:
+        return DATA_DIR / f"{cls.filename}.index"
+
+    @classmethod
+    def summary(cls, record: dict) -> dict:
+        """Champs gardés dans l'index (à étendre dans les subclasses)."""
+        return {cls.key: record[cls.key]}
+
+    # =====================
+    # Lecture
+    # =====================
+
     @classmethod
     def load(cls) -> list[dict]:
+        records = {}
+
         path = cls._file()
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                for record in json.load(f):
+                    records[record[cls.key]] = record
+
+        cls._journal_entries = cls._replay(records)
+        return list(records.values())
+
+    @classmethod
+    def _replay(cls, records: dict) -> int:
+        entries = cls._read_journal()
+        for entry in entries:
+            if entry["op"] == "put":
+                record = entry["record"]
+                records[record[cls.key]] = record
+            else:
+                records.pop(entry["key"], None)
+        return len(entries)
 
+    @classmethod
+    def _read_journal(cls) -> list[dict]:
+        path = cls._journal()
         if not path.exists():
             return []
 
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        entries = []
+        valid = 0
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Ligne à moitié écrite lors d'un crash : coupée plus bas
+                    break
+                valid += len(line)
+                entries.append(json.loads(line))
+
+        # Les prochains ajouts repartent d'une fin de ligne propre
+        if valid < path.stat().st_size:
+            os.truncate(path, valid)
+
+        return entries
 
     @classmethod
-    def save(cls, data: list[dict]):
+    def load_index(cls) -> list[dict]:
+        """Résumés de tous les enregistrements, sans décoder le snapshot."""
+        path, index = cls._file(), cls._index()
+        if path.exists() and (
+            not index.exists() or index.stat().st_mtime_ns < path.stat().st_mtime_ns
+        ):
+            # Snapshot sans index (ancien format) : on le réécrit une fois
+            cls.compact()
+
+        summaries = {}
+        cls._offsets = {}
+        cls._recent = {}
+        if index.exists():
+            with open(index, "r", encoding="utf-8") as f:
+                for summary in json.load(f):
+                    key = summary[cls.key]
+                    cls._offsets[key] = (summary.pop("offset"), summary.pop("length"))
+                    summaries[key] = summary
+
+        entries = cls._read_journal()
+        for entry in entries:
+            cls._apply_recent(entry)
+            if entry["op"] == "put":
+                record = entry["record"]
+                summaries[record[cls.key]] = cls.summary(record)
+            else:
+                summaries.pop(entry["key"], None)
+
+        cls._journal_entries = len(entries)
+        return list(summaries.values())
+
+    @classmethod
+    def load_one(cls, key) -> dict | None:
+        """Un enregistrement complet (après load_index())."""
+        with cls._lock:
+            if cls._offsets is None:
+                cls.load_index()
+
+            if key in cls._recent:
+                return cls._recent[key]
+            if key not in cls._offsets:
+                return None
+
+            offset, length = cls._offsets[key]
+            with open(cls._file(), "rb") as f:
+                f.seek(offset)
+                return json.loads(f.read(length))
+
+    @classmethod
+    def _apply_recent(cls, entry: dict):
+        if cls._recent is None:
+            return
+        if entry["op"] == "put":
+            record = entry["record"]
+            cls._recent[record[cls.key]] = record
+        else:
+            cls._recent[entry["key"]] = None
+
+    # =====================
+    # Écriture
+    # =====================
+
+    @classmethod
+    def save(cls, data: list[dict], encoded: list[bytes] | None = None):
+        """
+        Réécrit tout le snapshot et vide le journal.
+        encoded : formes JSON déjà encodées de `data` (même ordre), réutilisées telles quelles.
+        """
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+        # Une ligne par enregistrement, dont on note la position
+        lines = encoded or [json.dumps(record, ensure_ascii=False).encode("utf-8") for record in data]
+        summaries = []
+        offset = 2  # après "[\n"
+        for record, line in zip(data, lines):
+            summary = cls.summary(record)
+            summary["offset"] = offset
+            summary["length"] = len(line)
+            summaries.append(summary)
+            offset += len(line) + 2  # ",\n"
+
+        cls._write_atomic(cls._file(), b"[\n" + b",\n".join(lines) + b"\n]\n")
+        # Écrit après le snapshot : un index plus ancien est périmé
+        cls._write_atomic(
+            cls._index(),
+            json.dumps(summaries, ensure_ascii=False).encode("utf-8"),
+        )
+        cls._journal().unlink(missing_ok=True)
+        cls._journal_entries = 0
+
+        cls._offsets = {s[cls.key]: (s["offset"], s["length"]) for s in summaries}
+        cls._recent = {}
+
+    @classmethod
+    def put(cls, record: dict, encoded: bytes | None = None):
+        """
+        Ajoute ou remplace un enregistrement (même clé).
+        encoded : JSON de `record` déjà encodé (cache de l'objet), recopié sans ré-encodage.
+        """
+        cls._append({"op": "put", "record": record}, encoded)
+
+    @classmethod
+    def delete(cls, key):
+        cls._append({"op": "delete", "key": key})
+
+    @classmethod
+    def compact(cls):
+        with cls._lock:
+            cls.save(cls.load())
+
+    @classmethod
+    def _append(cls, entry: dict, encoded: bytes | None = None):
         DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-        with open(cls._file(), "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if encoded is None:
+            line = json.dumps(entry, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        else:
+            line = b'{"op":"put","record":' + encoded + b"}"
+
+        with cls._lock:
+            with open(cls._journal(), "ab") as f:
+                f.write(line + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+            cls._apply_recent(entry)
+            cls._journal_entries += 1
+            if cls._journal_entries >= COMPACT_EVERY:
+                cls.compact()
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes):
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
@@ -0,0 +1,241 @@
+import sqlite3
+import threading
+
+from storage.base import DATA_DIR
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tournaments (
+    id       INTEGER PRIMARY KEY,
+    name     TEXT NOT NULL,
+    format   TEXT NOT NULL,
+    date     TEXT NOT NULL,
+    date_key TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tournaments_date ON tournaments (date_key);
+CREATE INDEX IF NOT EXISTS tournaments_format ON tournaments (format, date_key);
+
+CREATE TABLE IF NOT EXISTS players (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id) ON DELETE CASCADE,
+    position      INTEGER NOT NULL,
+    name          TEXT NOT NULL,
+    name_key      TEXT NOT NULL,
+    PRIMARY KEY (tournament_id, name_key)
+);
+CREATE INDEX IF NOT EXISTS players_order ON players (tournament_id, position);
+"""
+
+
+def _date_key(date: str) -> str:
+    """JJ/MM/AAAA -> AAAA-MM-JJ, triable comme du texte."""
+    day, month, year = date.split("/")
+    return f"{year}-{month}-{day}"
+
+
+class SqliteStorage:
+    """
+    Même contrat que JsonStorage (load / save / put / delete), sur une
+    base SQLite en mode WAL, avec en plus des opérations unitaires.
+    Chaque opération ne touche que les lignes concernées : le coût ne
+    dépend pas de la taille de l'historique.
+    """
+
+    filename: str  # à définir dans les subclasses
+
+    _conn = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def _db(cls) -> sqlite3.Connection:
+        if cls._conn is None:
+            DATA_DIR.mkdir(parents=True, exist_ok=True)
+            # L'autosave écrit depuis un thread de fond, d'où le verrou
+            conn = sqlite3.connect(DATA_DIR / cls.filename, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.executescript(SCHEMA)
+            cls._conn = conn
+        return cls._conn
+
+    @classmethod
+    def close(cls):
+        if cls._conn is not None:
+            cls._conn.close()
+            cls._conn = None
+
+
+class SqliteTournamentStorage(SqliteStorage):
+    filename = "tournaments.db"
+
+    # =====================
+    # Contrat JsonStorage
+    # =====================
+
+    @classmethod
+    def load(cls) -> list[dict]:
+        with cls._lock:
+            db = cls._db()
+            rows = db.execute(
+                "SELECT id, name, format, date FROM tournaments ORDER BY id"
+            ).fetchall()
+
+            players = {}
+            for tid, name in db.execute(
+                "SELECT tournament_id, name FROM players ORDER BY tournament_id, position"
+            ):
+                players.setdefault(tid, []).append(name)
+
+        return [
+            {
+                "id": tid,
+                "name": name,
+                "format": fmt,
+                "date": date,
+                "players": players.get(tid, []),
+            }
+            for tid, name, fmt, date in rows
+        ]
+
+    @classmethod
+    def load_index(cls) -> list[dict]:
+        """Résumés (id, nom, format, date, nombre de joueurs), sans les joueurs."""
+        with cls._lock:
+            rows = cls._db().execute(
+                """
+                SELECT t.id, t.name, t.format, t.date,
+                       (SELECT COUNT(*) FROM players p WHERE p.tournament_id = t.id)
+                FROM tournaments t ORDER BY t.id
+                """
+            ).fetchall()
+
+        return [
+            {"id": tid, "name": name, "format": fmt, "date": date, "player_count": count}
+            for tid, name, fmt, date, count in rows
+        ]
+
+    @classmethod
+    def load_one(cls, tournament_id: int) -> dict | None:
+        with cls._lock:
+            db = cls._db()
+            row = db.execute(
+                "SELECT id, name, format, date FROM tournaments WHERE id = ?",
+                (tournament_id,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            players = [
+                name for (name,) in db.execute(
+                    "SELECT name FROM players WHERE tournament_id = ? ORDER BY position",
+                    (tournament_id,),
+                )
+            ]
+
+        tid, name, fmt, date = row
+        return {"id": tid, "name": name, "format": fmt, "date": date, "players": players}
+
+    @classmethod
+    def save(cls, data: list[dict], encoded=None):
+        """Remplace tout le contenu (import depuis le JSON par exemple)."""
+        with cls._lock, cls._db() as db:
+            db.execute("DELETE FROM tournaments")
+            for record in data:
+                cls._write(db, record)
+
+    @classmethod
+    def put(cls, record: dict, encoded=None):
+        """Insère ou remplace un tournoi (et sa liste de joueurs)."""
+        with cls._lock, cls._db() as db:
+            db.execute("DELETE FROM players WHERE tournament_id = ?", (record["id"],))
+            cls._write(db, record)
+
+    @classmethod
+    def delete(cls, tournament_id: int):
+        with cls._lock, cls._db() as db:
+            db.execute("DELETE FROM tournaments WHERE id = ?", (tournament_id,))
+
+    # =====================
+    # Opérations unitaires
+    # =====================
+
+    @classmethod
+    def insert(cls, record: dict):
+        with cls._lock, cls._db() as db:
+            cls._write(db, record, replace=False)
+
+    @classmethod
+    def update(cls, record: dict):
+        """Met à jour nom, format et date, sans toucher aux joueurs."""
+        with cls._lock, cls._db() as db:
+            db.execute(
+                "UPDATE tournaments SET name = ?, format = ?, date = ?, date_key = ? WHERE id = ?",
+                (record["name"], record["format"], record["date"],
+                 _date_key(record["date"]), record["id"]),
+            )
+
+    @classmethod
+    def add_player(cls, tournament_id: int, name: str) -> bool:
+        """Ajoute un joueur en fin de liste. False si déjà inscrit (casse ignorée)."""
+        with cls._lock, cls._db() as db:
+            cursor = db.execute(
+                """
+                INSERT OR IGNORE INTO players (tournament_id, position, name, name_key)
+                SELECT ?, COALESCE(MAX(position), -1) + 1, ?, ?
+                FROM players WHERE tournament_id = ?
+                """,
+                (tournament_id, name, name.casefold(), tournament_id),
+            )
+            return cursor.rowcount == 1
+
+    @classmethod
+    def remove_player(cls, tournament_id: int, name: str):
+        with cls._lock, cls._db() as db:
+            db.execute(
+                "DELETE FROM players WHERE tournament_id = ? AND name_key = ?",
+                (tournament_id, name.casefold()),
+            )
+
+    # =====================
+    # Requêtes (index)
+    # =====================
+
+    @classmethod
+    def between(cls, start: str, end: str) -> list[tuple]:
+        """(id, nom, format, date) des tournois entre deux dates JJ/MM/AAAA incluses."""
+        with cls._lock:
+            return cls._db().execute(
+                """
+                SELECT id, name, format, date FROM tournaments
+                WHERE date_key BETWEEN ? AND ? ORDER BY date_key
+                """,
+                (_date_key(start), _date_key(end)),
+            ).fetchall()
+
+    @classmethod
+    def by_format(cls, fmt: str) -> list[tuple]:
+        with cls._lock:
+            return cls._db().execute(
+                "SELECT id, name, format, date FROM tournaments WHERE format = ? ORDER BY date_key",
+                (fmt,),
+            ).fetchall()
+
+    @staticmethod
+    def _write(db, record: dict, replace=True):
+        upsert = """
+            ON CONFLICT (id) DO UPDATE SET
+                name = excluded.name, format = excluded.format,
+                date = excluded.date, date_key = excluded.date_key
+        """ if replace else ""
+        db.execute(
+            "INSERT INTO tournaments (id, name, format, date, date_key) VALUES (?, ?, ?, ?, ?)" + upsert,
+            (record["id"], record["name"], record["format"], record["date"],
+             _date_key(record["date"])),
+        )
+        db.executemany(
+            "INSERT OR IGNORE INTO players (tournament_id, position, name, name_key) VALUES (?, ?, ?, ?)",
+            [
+                (record["id"], position, name, name.casefold())
+                for position, name in enumerate(record.get("players", []))
+            ],
+        )
@@ -3,3 +3,13 @@ from storage.base import JsonStorage
 
 class TournamentStorage(JsonStorage):
     filename = "tournaments.json"
+
+    @classmethod
+    def summary(cls, record: dict) -> dict:
+        return {
+            "id": record["id"],
+            "name": record["name"],
+            "format": record["format"],
+            "date": record["date"],
+            "player_count": len(record.get("players", [])),
+        }
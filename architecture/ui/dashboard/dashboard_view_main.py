@@ -10,19 +10,7 @@ class DashboardViewMain(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        self.player_matches = {
-            "Martin": [
-                {"round": 1, "table": 3, "position": "1er"},
-                {"round": 2, "table": 1, "position": "2e"},
-                {"round": 3, "table": 5, "position": "5er"},
-                {"round": 4, "table": 3, "position": "4e"},
-                {"round": 5, "table": 2, "position": "1e"},
-            ],
-            "Audric": [
-                {"round": 1, "table": 2, "position": "2e"},
-                {"round": 2, "table": 4, "position": "3e"},
-            ],
-        }
+        self.tournament = None
 
         root = QVBoxLayout(self)
         root.setSpacing(30)
@@ -34,7 +22,7 @@ class DashboardViewMain(QWidget):
 
         # === CLASSEMENT ===
         self.ranking_view = DashboardRankingView(self)
-        self.ranking_view.set_player_matches(self.player_matches)
+        self.ranking_view.set_player_matches(self._player_matches)
         root.addWidget(self.ranking_view)
 
         # === TABLES DE JEU ===
@@ -51,6 +39,34 @@ class DashboardViewMain(QWidget):
         self.timer.timeout.connect(self._tick)
         self.timer.start(1000)
 
+    def set_tournament(self, tournament):
+        """
+        Branche le dashboard sur un tournoi du moteur (tournament.Tournament).
+        """
+        self.tournament = tournament
+        self.refresh_ranking()
+        self.refresh_tables()
+
+    def refresh_ranking(self):
+        if self.tournament is not None:
+            self.ranking_view.set_ranking(self.tournament.ranking_rows())
+
+    def refresh_tables(self):
+        """Nouveau round (ou joueurs réassis) : les cartes suivent tournament.tables."""
+        if self.tournament is not None:
+            self.tables_view.set_tables(self.tournament.tables)
+
+    def result_entered(self, table_id):
+        """Résultat saisi pour une table : sa carte seule, puis le classement."""
+        self.tables_view.table_updated(table_id)
+        self.refresh_ranking()
+
+    def _player_matches(self, player_id):
+        """Matchs joués, lus dans l'historique des rounds du tournoi."""
+        if self.tournament is None:
+            return None
+        return self.tournament.player_matches(player_id)
+
     def _tick(self):
         if self.remaining_seconds <= 0:
             return
@@ -0,0 +1,195 @@
+from bisect import bisect_left
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor
+
+
+HEADERS = ("#", "Joueur", "Évolution")
+
+UP_COLOR = QColor(Qt.green)
+DOWN_COLOR = QColor(Qt.red)
+STILL_COLOR = QColor(Qt.lightGray)
+
+
+def _longest_increasing(values):
+    """Indices d'une plus longue sous-suite strictement croissante de `values`."""
+    tails = []          # plus petite fin de sous-suite pour chaque longueur
+    tails_at = []       # indice (dans values) de cette fin
+    previous = [-1] * len(values)
+
+    for i, value in enumerate(values):
+        length = bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tails_at.append(i)
+        else:
+            tails[length] = value
+            tails_at[length] = i
+        previous[i] = tails_at[length - 1] if length else -1
+
+    kept = set()
+    i = tails_at[-1] if tails_at else -1
+    while i != -1:
+        kept.add(i)
+        i = previous[i]
+    return kept
+
+
+def _row_moves(current, order):
+    """
+    Déplacements (source, destination avant déplacement) qui font passer
+    la liste `current` à `order` (mêmes éléments). Les éléments d'une plus
+    longue sous-suite déjà dans le bon ordre restent en place : seuls les
+    autres bougent, chacun une fois.
+    """
+    rows = list(current)
+    position = {pid: row for row, pid in enumerate(rows)}
+    kept = _longest_increasing([position[pid] for pid in order])
+
+    # Pour chaque rang cible, le prochain élément resté en place
+    successors = [None] * len(order)
+    following = None
+    for target in range(len(order) - 1, -1, -1):
+        successors[target] = following
+        if target in kept:
+            following = order[target]
+
+    moves = []
+    for target, pid in enumerate(order):
+        if target in kept:
+            continue
+
+        # Se place juste avant le prochain élément resté en place
+        successor = successors[target]
+        src = rows.index(pid)
+        dest = rows.index(successor) if successor is not None else len(rows)
+        if dest in (src, src + 1):
+            continue
+
+        moves.append((src, dest))
+        del rows[src]
+        rows.insert(dest - 1 if src < dest else dest, pid)
+
+    return moves
+
+
+class RankingModel(QAbstractTableModel):
+    """
+    Classement affiché : une ligne par joueur, dans l'ordre des standings.
+
+    set_ranking() compare au classement affiché et ne signale que le
+    nécessaire : lignes déplacées (beginMoveRows, en déplaçant le moins
+    de joueurs possible), dataChanged pour un nom ou une évolution
+    modifiés, insertions / suppressions pour les arrivées et départs.
+    Le rang affiché est la position de la ligne.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._ids: list[int] = []
+        # id -> (nom, évolution)
+        self._values: dict[int, tuple[str, int]] = {}
+
+    # =====================
+    # Qt
+    # =====================
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row, column = index.row(), index.column()
+        name, delta = self._values[self._ids[row]]
+
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return str(row + 1)
+            if column == 1:
+                return name
+            if delta > 0:
+                return f"▲ +{delta}"
+            if delta < 0:
+                return f"▼ {delta}"
+            return "— 0"
+
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignCenter)
+
+        if role == Qt.ForegroundRole and column == 2:
+            if delta > 0:
+                return UP_COLOR
+            if delta < 0:
+                return DOWN_COLOR
+            return STILL_COLOR
+
+        return None
+
+    def player(self, row: int) -> tuple[int, str]:
+        """(id, nom) du joueur affiché à cette ligne."""
+        pid = self._ids[row]
+        return pid, self._values[pid][0]
+
+    # =====================
+    # Mise à jour incrémentale
+    # =====================
+
+    def set_ranking(self, rows):
+        """rows : (rang, id, nom, évolution), dans l'ordre du classement."""
+        order = [pid for _, pid, _, _ in rows]
+        values = {pid: (name, delta) for _, pid, name, delta in rows}
+
+        self._remove_missing(values)
+        self._append_new(order)
+        self._reorder(order)
+        self._refresh_values(values)
+
+    def _remove_missing(self, values):
+        # De bas en haut pour garder les indices valides
+        for row in range(len(self._ids) - 1, -1, -1):
+            if self._ids[row] not in values:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._values[self._ids[row]]
+                del self._ids[row]
+                self.endRemoveRows()
+
+    def _append_new(self, order):
+        new = [pid for pid in order if pid not in self._values]
+        if not new:
+            return
+
+        first = len(self._ids)
+        self.beginInsertRows(QModelIndex(), first, first + len(new) - 1)
+        self._ids.extend(new)
+        for pid in new:
+            self._values[pid] = ("", 0)
+        self.endInsertRows()
+
+    def _reorder(self, order):
+        if order == self._ids:
+            return
+
+        for src, dest in _row_moves(self._ids, order):
+            pid = self._ids[src]
+            self.beginMoveRows(QModelIndex(), src, src, QModelIndex(), dest)
+            del self._ids[src]
+            self._ids.insert(dest - 1 if src < dest else dest, pid)
+            self.endMoveRows()
+
+    def _refresh_values(self, values):
+        last = len(HEADERS) - 1
+        for row, pid in enumerate(self._ids):
+            if self._values[pid] != values[pid]:
+                self._values[pid] = values[pid]
+                self.dataChanged.emit(self.index(row, 1), self.index(row, last))
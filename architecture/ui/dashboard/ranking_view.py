@@ -1,10 +1,15 @@
 from PySide6.QtWidgets import (
     QFrame, QVBoxLayout, QLabel,
-    QTableWidget, QTableWidgetItem, QHeaderView
+    QTableView, QHeaderView
 )
 from PySide6.QtCore import Qt, QPoint, QEvent
 from PySide6.QtGui import QCursor
 from ui.widgets.player_matches_popup import PlayerMatchesPopup
+from ui.dashboard.ranking_model import RankingModel
+
+
+# Nombre de lignes visibles souhaitées (hauteur du tableau)
+VISIBLE_ROWS = 7
 
 
 class DashboardRankingView(QFrame):
@@ -13,7 +18,8 @@ class DashboardRankingView(QFrame):
 
         self.setObjectName("DashboardCard")
 
-        self.player_matches = {}
+        # id du joueur -> liste des matchs (ou None), fourni par le dashboard
+        self._matches_for = lambda player_id: None
 
         self._last_popup_pos = None
 
@@ -24,17 +30,20 @@ class DashboardRankingView(QFrame):
         title.setObjectName("DashboardSectionTitle")
         layout.addWidget(title)
 
-        table = QTableWidget(0, 3)
+        # Modèle : seules les lignes qui changent sont signalées à la vue
+        self.model = RankingModel(self)
+
+        table = QTableView()
         table.setObjectName("DashboardTable")
+        table.setModel(self.model)
 
         # --- Structure ---
-        table.setHorizontalHeaderLabels(["#", "Joueur", "Évolution"])
         table.verticalHeader().setVisible(False)
 
         # --- Comportement ---
-        table.setEditTriggers(QTableWidget.NoEditTriggers)
-        table.setSelectionBehavior(QTableWidget.SelectRows)
-        table.setSelectionMode(QTableWidget.SingleSelection)
+        table.setEditTriggers(QTableView.NoEditTriggers)
+        table.setSelectionBehavior(QTableView.SelectRows)
+        table.setSelectionMode(QTableView.SingleSelection)
         table.setFocusPolicy(Qt.NoFocus)
         table.setCursor(Qt.PointingHandCursor)
 
@@ -50,60 +59,6 @@ class DashboardRankingView(QFrame):
         header.setSectionResizeMode(1, QHeaderView.Stretch)
         header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
 
-        data = [
-            (1, "Martin", +2),
-            (2, "Audric", -1),
-            (3, "Luc", +2),
-            (4, "Emma", -2),
-            (5, "Nina", -4),
-            (6, "Gael", +2),
-            (7, "Chouchou", -2),
-            (8, "Raph", +3),
-            (9, "Dylan", 0),
-            (10, "Pirate", +1),
-            (11, "Lou", +2),
-            (12, "Seb", -3),
-            (13, "Sebito", -1),
-            (14, "Thomas", +1),
-            (15, "Mathieux", -4),
-        ]
-
-        # 🔑 CRUCIAL : on fixe les lignes AVANT de remplir
-        table.setRowCount(len(data))
-
-        for row, (pos, name, delta) in enumerate(data):
-            item_pos = QTableWidgetItem(str(pos))
-            item_pos.setTextAlignment(Qt.AlignCenter)
-            table.setItem(row, 0, item_pos)
-
-            item_name = QTableWidgetItem(name)
-            item_name.setTextAlignment(Qt.AlignCenter) 
-            table.setItem(row, 1, item_name)
-
-            if delta > 0:
-                txt = f"▲ +{delta}"
-                color = Qt.green
-            elif delta < 0:
-                txt = f"▼ {delta}"
-                color = Qt.red
-            else:
-                txt = "— 0"
-                color = Qt.lightGray
-
-            item = QTableWidgetItem(txt)
-            item.setTextAlignment(Qt.AlignCenter)
-            item.setForeground(color)
-            table.setItem(row, 2, item)
-
-            # Hauteur dynamique (évite zone blanche)
-            VISIBLE_ROWS = 7  # nombre de lignes visibles souhaitées
-
-            table.setFixedHeight(
-                table.horizontalHeader().height()
-                + table.rowHeight(0) * VISIBLE_ROWS
-                + 4
-            )
-
         layout.addWidget(table)
 
         table.setMouseTracking(True)
@@ -112,9 +67,7 @@ class DashboardRankingView(QFrame):
         self.popup = PlayerMatchesPopup(self)
         self.popup.hide()
 
-        table.itemEntered.connect(
-            lambda item: self._on_player_hover(table, item)
-        )
+        table.entered.connect(self._on_player_hover)
 
         self.ranking_table = table
         self.ranking_viewport = table.viewport()
@@ -122,28 +75,55 @@ class DashboardRankingView(QFrame):
 
         table.viewport().installEventFilter(self)
 
-    def set_player_matches(self, player_matches: dict):
-        self.player_matches = player_matches
+        # Hauteur fixe, calculée une seule fois (évite zone blanche)
+        table.setFixedHeight(
+            table.horizontalHeader().sizeHint().height()
+            + table.verticalHeader().defaultSectionSize() * VISIBLE_ROWS
+            + 4
+        )
+
+        # --- MOCK DATA (remplacé par set_ranking) ---
+        self.set_ranking([
+            (1, 1, "Martin", +2),
+            (2, 2, "Audric", -1),
+            (3, 3, "Luc", +2),
+            (4, 4, "Emma", -2),
+            (5, 5, "Nina", -4),
+            (6, 6, "Gael", +2),
+            (7, 7, "Chouchou", -2),
+            (8, 8, "Raph", +3),
+            (9, 9, "Dylan", 0),
+            (10, 10, "Pirate", +1),
+            (11, 11, "Lou", +2),
+            (12, 12, "Seb", -3),
+            (13, 13, "Sebito", -1),
+            (14, 14, "Thomas", +1),
+            (15, 15, "Mathieux", -4),
+        ])
+
+    def set_ranking(self, rows):
+        """
+        rows : (rang, id, nom, évolution), par exemple Tournament.ranking_rows()
+        du moteur. Appelé après chaque résultat : le modèle ne déplace et ne
+        repeint que les joueurs dont la place ou l'évolution a changé.
+        """
+        self.model.set_ranking(rows)
+
+    def set_player_matches(self, matches_for):
+        """matches_for(id du joueur) -> [{"round", "table", "position"}], lu au survol."""
+        self._matches_for = matches_for
 
     # =================================================
     # Hover
     # =================================================
-    def _on_player_hover(self, table, item):
-        if not item:
-            self.popup.hide()
-            self._last_popup_pos = None
-            return
-
-        row = item.row()
-        name_item = table.item(row, 1)
-
-        if not name_item:
+    def _on_player_hover(self, index):
+        if not index.isValid():
             self.popup.hide()
             self._last_popup_pos = None
             return
 
-        name = name_item.text()
-        matches = self.player_matches.get(name)
+        player_id, name = self.model.player(index.row())
+        matches = self._matches_for(player_id)
 
         if not matches:
             self.popup.hide()
@@ -0,0 +1,165 @@
+from bisect import bisect_left
+
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QSize
+from PySide6.QtGui import QColor, QFont, QLinearGradient, QPainter, QPen
+from PySide6.QtWidgets import QStyle, QStyledItemDelegate
+
+
+# Rôle donnant la table (objet Table du moteur) d'une ligne
+TableRole = Qt.UserRole + 1
+
+
+def table_winner(table) -> str | None:
+    """Nom du (ou des, à égalité) meilleur(s) score(s) de la table, None sans résultat."""
+    if not table.result:
+        return None
+
+    best = max(table.result.values())
+    return ", ".join(p.name for p in table.players if table.result.get(p.id) == best)
+
+
+# =========================
+# MODÈLE
+# =========================
+
+class TablesModel(QAbstractListModel):
+    """
+    Tables du round en cours. Le modèle garde sa propre liste (les objets
+    Table restent ceux du moteur) : le moteur modifie tournament.tables
+    sur place, le nombre de lignes ne change qu'avec set_tables().
+    Un résultat ne signale que la ligne de sa table.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tables = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._tables)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        table = self._tables[index.row()]
+        if role == TableRole:
+            return table
+        if role == Qt.DisplayRole:
+            return f"Table {table.id}"
+        if role == Qt.ToolTipRole:
+            return " vs ".join(p.name for p in table.players)
+        return None
+
+    def set_tables(self, tables):
+        """Nouveau round (ou tables réassises) : la liste change entièrement."""
+        self.beginResetModel()
+        self._tables = list(tables)
+        self.endResetModel()
+
+    def table_updated(self, table_id: int):
+        """Résultat saisi pour une table : seule sa carte est repeinte."""
+        # Tables rangées par numéro croissant
+        row = bisect_left(self._tables, table_id, key=lambda t: t.id)
+        if row < len(self._tables) and self._tables[row].id == table_id:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+
+# =========================
+# DÉLÉGUÉ (carte peinte)
+# =========================
+
+class TableCardDelegate(QStyledItemDelegate):
+    """
+    Peint une carte de table (mêmes couleurs que #TableCard) : aucun
+    widget par table, seules les cartes visibles sont peintes.
+    """
+
+    WIDTH = 220
+    HEIGHT = 150
+    SPACING = 16
+    RADIUS = 16
+    PADDING = 14
+
+    TOP = QColor("#1f6b4f")
+    BOTTOM = QColor("#123b2e")
+    BORDER = QColor(255, 255, 255, 15)
+    BORDER_HOVER = QColor(63, 210, 125, 153)
+    TITLE = QColor("#eafff5")
+    PLAYERS = QColor("#cfeee2")
+    RUNNING = QColor("#f5d76e")
+    FINISHED = QColor("#8fdcc0")
+    WINNER = QColor("#3fd27d")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._title_font = QFont()
+        self._title_font.setPixelSize(14)
+        self._title_font.setWeight(QFont.ExtraBold)
+
+        self._players_font = QFont()
+        self._players_font.setPixelSize(13)
+
+        self._status_font = QFont()
+        self._status_font.setWeight(QFont.DemiBold)
+
+        self._winner_font = QFont()
+        self._winner_font.setWeight(QFont.Bold)
+
+    def sizeHint(self, option, index):
+        return QSize(self.WIDTH + self.SPACING, self.HEIGHT)
+
+    def paint(self, painter, option, index):
+        table = index.data(TableRole)
+        if table is None:
+            return
+
+        card = QRect(option.rect.left(), option.rect.top(), self.WIDTH, self.HEIGHT).adjusted(0, 0, -1, -1)
+        hover = bool(option.state & QStyle.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # === FOND ===
+        gradient = QLinearGradient(card.topLeft(), card.bottomLeft())
+        gradient.setColorAt(0, self.TOP)
+        gradient.setColorAt(1, self.BOTTOM)
+        painter.setPen(QPen(self.BORDER_HOVER if hover else self.BORDER, 1))
+        painter.setBrush(gradient)
+        painter.drawRoundedRect(card, self.RADIUS, self.RADIUS)
+
+        inner = card.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+        y = inner.top()
+
+        # === NUMÉRO ===
+        y = self._line(painter, inner, y, self._title_font, self.TITLE, f"Table {table.id}")
+
+        # === JOUEURS (2 lignes max) ===
+        painter.setFont(self._players_font)
+        painter.setPen(self.PLAYERS)
+        players = QRect(inner.left(), y, inner.width(), min(40, painter.fontMetrics().height() * 2))
+        painter.drawText(players, Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap,
+                         " vs ".join(p.name for p in table.players))
+        y = players.bottom() + 6
+
+        # === STATUT / GAGNANT ===
+        winner = table_winner(table)
+        if winner is None:
+            self._line(painter, inner, y, self._status_font, self.RUNNING, "⏳ En cours")
+        else:
+            y = self._line(painter, inner, y, self._status_font, self.FINISHED, "✔ Terminée")
+            self._line(painter, inner, y, self._winner_font, self.WINNER, f"Gagnant : {winner}")
+
+        painter.restore()
+
+    def _line(self, painter, inner, y, font, color, text):
+        painter.setFont(font)
+        painter.setPen(color)
+        metrics = painter.fontMetrics()
+        painter.drawText(
+            QRect(inner.left(), y, inner.width(), metrics.height()),
+            Qt.AlignLeft | Qt.AlignVCenter,
+            metrics.elidedText(text, Qt.ElideRight, inner.width()),
+        )
+        return y + metrics.height() + 6
@@ -1,10 +1,44 @@
+from types import SimpleNamespace
+
 from PySide6.QtWidgets import (
-    QFrame, QVBoxLayout, QHBoxLayout,
-    QLabel, QWidget
+    QFrame, QVBoxLayout,
+    QLabel, QListView
 )
 from PySide6.QtCore import Qt
 
-from ui.widgets.horizontal_scroll_area import HorizontalScrollArea
+from ui.dashboard.tables_model import TablesModel, TableCardDelegate
+
+
+class TablesListView(QListView):
+    """Bandeau horizontal de cartes peintes par TableCardDelegate."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.setFlow(QListView.LeftToRight)
+        self.setWrapping(False)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QListView.NoSelection)
+        self.setHorizontalScrollMode(QListView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setMouseTracking(True)
+        self.setItemDelegate(TableCardDelegate(self))
+
+        # Une carte de haut + les marges du bandeau
+        self.setFixedHeight(TableCardDelegate.HEIGHT + 4)
+        self.setViewportMargins(16, 0, 16, 0)  # ⬅️ empêche le blanc latéral
+
+    def wheelEvent(self, event):
+        # Molette verticale → scroll horizontal
+        delta = event.angleDelta().y()
+
+        if delta != 0:
+            bar = self.horizontalScrollBar()
+            bar.setValue(bar.value() - delta)
+
+        event.accept()
 
 
 class DashboardTablesView(QFrame):
@@ -20,104 +54,40 @@ class DashboardTablesView(QFrame):
         title.setObjectName("DashboardSectionTitle")
         layout.addWidget(title)
 
-        scroll = HorizontalScrollArea()
-        scroll.setObjectName("TablesScrollArea")  # ⬅️ IMPORTANT
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setFrameShape(QFrame.NoFrame)
-
-        container = QWidget()
-        container.setObjectName("TablesScrollContent")  # ⬅️ IMPORTANT
-
-        h_layout = QHBoxLayout(container)
-        h_layout.setSpacing(16)
-        h_layout.setContentsMargins(16, 0, 16, 0)  # ⬅️ empêche le blanc latéral
-
-        # --- MOCK DATA ---
-        tables = [
-            {
-                "id": 1,
-                "players": ["Martin", "Jean-Francois", "Gael", "Gaethan"],
-                "finished": True,
-                "winner": "None",
-            },
-            {
-                "id": 2,
-                "players": ["Audric", "Emma"],
-                "finished": True,
-                "winner": "Audric",
-            },
-            {
-                "id": 3,
-                "players": ["Nina", "Paul", "Tom"],
-                "finished": False,
-                "winner": None,
-            },
-            {
-                "id": 4,
-                "players": ["Nina", "Paul", "Tom"],
-                "finished": False,
-                "winner": None,
-            },
-            {
-                "id": 5,
-                "players": ["Nina", "Paul", "Tom"],
-                "finished": False,
-                "winner": None,
-            },
-        ]
-
-        for t in tables:
-            h_layout.addWidget(self._table_card(t))
-
-        h_layout.addStretch()
-        scroll.setWidget(container)
-
-        layout.addWidget(scroll)
-
-    def _table_card(self, table):
-        card = QFrame()
-        card.setObjectName("TableCard")
-        card.setFixedWidth(220)
-        card.setFixedHeight(150)
-
-        layout = QVBoxLayout(card)
-        layout.setSpacing(6)
-
-        lbl_id = QLabel(f"Table {table['id']}")
-        lbl_id.setObjectName("TableCardTitle")
-
-        players = table["players"]  # liste de noms
-        players_text = " vs ".join(players)
-
-        lbl_players = QLabel(players_text)
-        lbl_players.setObjectName("TableCardPlayers")
-        lbl_players.setWordWrap(True)
-        lbl_players.setMaximumHeight(40)  # force 2 lignes max
-
-        if table["finished"]:
-            status = QLabel("✔ Terminée")
-            status.setObjectName("TableCardFinished")
-
-            winner = QLabel(f"Gagnant : {table['winner']}")
-            winner.setObjectName("TableCardWinner")
-
-            layout.addWidget(lbl_id)
-            layout.addWidget(lbl_players)
-            layout.addWidget(status)
-            layout.addWidget(winner)
-        else:
-            status = QLabel("⏳ En cours")
-            status.setObjectName("TableCardRunning")
-
-            layout.addWidget(lbl_id)
-            layout.addWidget(lbl_players)
-            layout.addWidget(status)
-
-        if table["finished"]:
-            card.setProperty("status", "finished")
-        else:
-            card.setProperty("status", "running")
-
-        return card
+        # Modèle : les tables du round en cours, sans widget par table
+        self.model = TablesModel(self)
+
+        strip = TablesListView()
+        strip.setObjectName("TablesScrollArea")  # ⬅️ IMPORTANT
+        strip.setModel(self.model)
+        layout.addWidget(strip)
+
+        self.strip = strip
+
+        # --- MOCK DATA (remplacé par set_tables) ---
+        self.set_tables(_mock_tables())
+
+    def set_tables(self, tables):
+        """
+        tables : tables du round en cours, par exemple tournament.tables
+        du moteur (objets Table), rangées par numéro.
+        """
+        self.model.set_tables(tables)
+
+    def table_updated(self, table_id: int):
+        """À appeler après un résultat : seule cette carte est repeinte."""
+        self.model.table_updated(table_id)
+
+
+def _mock_tables():
+    def table(table_id, names, result=None):
+        players = [SimpleNamespace(id=i, name=name) for i, name in enumerate(names)]
+        return SimpleNamespace(id=table_id, players=players, result=result or {})
+
+    return [
+        table(1, ["Martin", "Jean-Francois", "Gael", "Gaethan"], {0: 1, 1: 1, 2: 1, 3: 1}),
+        table(2, ["Audric", "Emma"], {0: 3, 1: 0}),
+        table(3, ["Nina", "Paul", "Tom"]),
+        table(4, ["Nina", "Paul", "Tom"]),
+        table(5, ["Nina", "Paul", "Tom"]),
+    ]
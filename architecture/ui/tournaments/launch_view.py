@@ -14,6 +14,7 @@ from PySide6.QtWidgets import (
 import json
 
 from core.tournament import Tournament
+from core.repository import TournamentRepository
 
 
 class LaunchView(QWidget):
@@ -28,9 +29,10 @@ class LaunchView(QWidget):
     tournament_cancelled = Signal(int)
     edit_requested = Signal(Tournament)
 
-    def __init__(self, parent=None):
+    def __init__(self, repository: TournamentRepository, parent=None):
         super().__init__(parent)
 
+        self.repository = repository
         self._current_tournament: Tournament | None = None
 
         self.setObjectName("LaunchView")
@@ -189,7 +191,8 @@ class LaunchView(QWidget):
 
         raw = event.mimeData().data("application/x-magictable-tournament")
         data = json.loads(bytes(raw).decode("utf-8"))
-        tournament = Tournament.from_dict(data)
+        # Le tournoi du dépôt, pas une copie : les modifications sont partagées
+        tournament = self.repository.get(data["id"]) or Tournament.from_dict(data)
 
         self._load_tournament(tournament)
         self.tournament_taken.emit(tournament.id)
@@ -199,6 +202,7 @@ class LaunchView(QWidget):
     # State
     # ======================================================
     def _load_tournament(self, tournament: Tournament):
+        tournament.ensure_loaded()
         self._current_tournament = tournament
 
         self.placeholder_widget.hide()
@@ -246,6 +250,8 @@ class LaunchView(QWidget):
             return
 
         if self._current_tournament.add_player(name):
+            if self._current_tournament.id in self.repository:
+                self.repository.update(self._current_tournament)
             self.players_list.addItem(QListWidgetItem(name))
             self.player_input.clear()
             self._update_tables_info()
@@ -1,4 +1,5 @@
 from PySide6.QtWidgets import (
+    QApplication,
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
@@ -7,6 +8,9 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 
 from core.tournament import Tournament
+from core.repository import TournamentRepository
+from storage.tournaments import TournamentStorage
+from storage.autosave import AutosaveService
 from ui.tournaments.upcoming_view import UpcomingView
 from ui.tournaments.launch_view import LaunchView
 from ui.tournaments.historic_view import HistoricView
@@ -25,6 +29,14 @@ class TournamentViewMain(QWidget):
         self.setAttribute(Qt.WA_StyledBackground, True)
         self.setObjectName("TournamentViewMain")
 
+        # Écritures regroupées, faites hors du thread de l'interface
+        self._autosave = AutosaveService(TournamentStorage)
+        QApplication.instance().aboutToQuit.connect(self._autosave.close)
+
+        # Dépôt partagé par Upcoming / Launch (résumés seulement au démarrage)
+        self.repository = TournamentRepository(autosave=self._autosave)
+        self.repository.load(TournamentStorage.load_index(), TournamentStorage.load_one)
+
         self._build_ui()
         self._connect_views()
 
@@ -72,7 +84,7 @@ class TournamentViewMain(QWidget):
         layout = QVBoxLayout(frame)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        self.upcoming_view = UpcomingView(self)
+        self.upcoming_view = UpcomingView(self.repository, self)
         layout.addWidget(self.upcoming_view)
 
         return frame
@@ -85,7 +97,7 @@ class TournamentViewMain(QWidget):
         layout = QVBoxLayout(frame)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        self.launch_view = LaunchView(self)
+        self.launch_view = LaunchView(self.repository, self)
         layout.addWidget(self.launch_view)
 
         return frame
@@ -149,5 +161,5 @@ class TournamentViewMain(QWidget):
         dialog.apply_changes()
 
         # Rafraîchir les deux vues
-        self.upcoming_view.refresh_tournament(tournament)
+        self.repository.update(tournament)
         self.launch_view._load_tournament(tournament)
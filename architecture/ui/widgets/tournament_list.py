@@ -0,0 +1,345 @@
+from PySide6.QtCore import (
+    Qt,
+    Signal,
+    QAbstractListModel,
+    QModelIndex,
+    QMimeData,
+    QPoint,
+    QRect,
+    QSize,
+)
+from PySide6.QtGui import QColor, QDrag, QFont, QPainter, QPen, QPixmap
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QListView,
+    QMenu,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+)
+import json
+from datetime import date
+
+from core.tournament import Tournament
+from core.repository import TournamentRepository
+
+
+TOURNAMENT_MIME = "application/x-magictable-tournament"
+
+# Rôle donnant l'objet Tournament d'une ligne
+TournamentRole = Qt.UserRole + 1
+
+
+# =========================
+# MODÈLE
+# =========================
+
+class TournamentListModel(QAbstractListModel):
+    """
+    Tournois à venir du dépôt (repository.upcoming), du plus proche au
+    plus lointain, puis les passés (repository.past), du plus récent au
+    plus ancien, moins ceux masqués (envoyés en Launch). Les passés
+    restent ici tant qu'aucune liste d'historique ne les affiche.
+    Le modèle ne garde que les ids affichés : les données sont lues dans
+    le dépôt au moment de peindre.
+    """
+
+    def __init__(self, repository: TournamentRepository, parent=None):
+        super().__init__(parent)
+
+        self.repository = repository
+        self._hidden: set[int] = set()
+        # Date de référence fixée à l'ouverture : l'ordre des autres
+        # lignes ne bouge pas entre deux événements du dépôt
+        self._today = date.today().strftime("%d/%m/%Y")
+        self._ids: list[int] = self._visible_ids()
+
+        repository.add_listener(self._on_repository_changed)
+
+    # --- Qt ---
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._ids)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        tournament = self.repository.get(self._ids[index.row()])
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return tournament.name
+        if role == TournamentRole:
+            return tournament
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsDragEnabled
+
+    def mimeTypes(self):
+        return [TOURNAMENT_MIME]
+
+    def mimeData(self, indexes):
+        mime = QMimeData()
+        if indexes:
+            # Sérialisation MÉTIER → JSON
+            tournament = self.tournament(indexes[0])
+            payload = json.dumps(tournament.to_dict())
+            mime.setData(TOURNAMENT_MIME, payload.encode("utf-8"))
+        return mime
+
+    # --- Accès ---
+    def tournament(self, index) -> Tournament:
+        return self.repository.get(self._ids[index.row()])
+
+    def hide(self, tournament_id: int):
+        if tournament_id in self._hidden:
+            return
+        self._hidden.add(tournament_id)
+        self._sync(tournament_id)
+
+    def show(self, tournament_id: int):
+        if tournament_id not in self._hidden:
+            return
+        self._hidden.discard(tournament_id)
+        self._sync(tournament_id)
+
+    # --- Dépôt ---
+    def _visible_ids(self) -> list[int]:
+        # Date illisible : classée parmi les passés, jamais perdue
+        tournaments = self.repository.upcoming(self._today) + self.repository.past(self._today)
+        return [t.id for t in tournaments if t.id not in self._hidden]
+
+    def _on_repository_changed(self, event: str, tournament: Tournament):
+        tid = tournament.id
+        if event == "removed":
+            self._hidden.discard(tid)
+        self._sync(tid, changed=event == "updated")
+
+    def _sync(self, tournament_id: int, changed: bool = False):
+        """
+        Replace une seule ligne : les autres ne bougent pas entre deux
+        événements, seule celle-ci peut entrer, sortir ou changer de rang
+        (date modifiée, masquée, supprimée...).
+        """
+        target = self._visible_ids()
+        row = target.index(tournament_id) if tournament_id in target else None
+
+        if tournament_id in self._ids:
+            current = self._ids.index(tournament_id)
+            if current == row:
+                if changed:
+                    index = self.index(row)
+                    self.dataChanged.emit(index, index)
+                return
+            self._remove_row(tournament_id)
+
+        if row is not None:
+            self._insert_row(row, tournament_id)
+
+    def _insert_row(self, row: int, tournament_id: int):
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._ids.insert(row, tournament_id)
+        self.endInsertRows()
+
+    def _remove_row(self, tournament_id: int):
+        row = self._ids.index(tournament_id)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._ids[row]
+        self.endRemoveRows()
+
+
+# =========================
+# DÉLÉGUÉ (carte peinte)
+# =========================
+
+class TournamentCardDelegate(QStyledItemDelegate):
+    """
+    Peint la carte d'un tournoi (mêmes couleurs que #TournamentCard) :
+    aucun widget par ligne.
+    """
+
+    CARD_HEIGHT = 88
+    SPACING = 12
+    RADIUS = 14
+
+    BACKGROUND = QColor("#153a2e")
+    BACKGROUND_HOVER = QColor("#1c4a3a")
+    BORDER = QColor("#2f6f55")
+    BORDER_HOVER = QColor("#3ad68a")
+    TITLE = QColor("#eafff6")
+    FORMAT = QColor("#7de2a8")
+    META = QColor("#b6dcd0")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._title_font = QFont()
+        self._title_font.setPixelSize(15)
+        self._title_font.setWeight(QFont.DemiBold)
+
+        self._format_font = QFont()
+        self._format_font.setPixelSize(13)
+        self._format_font.setWeight(QFont.Medium)
+
+        self._meta_font = QFont()
+        self._meta_font.setPixelSize(12)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.CARD_HEIGHT + self.SPACING)
+
+    def paint(self, painter, option, index):
+        tournament = index.data(TournamentRole)
+        if tournament is None:
+            return
+
+        hover = bool(option.state & QStyle.State_MouseOver)
+        card = option.rect.adjusted(0, 0, -1, -self.SPACING - 1)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # === FOND ===
+        painter.setPen(QPen(self.BORDER_HOVER if hover else self.BORDER, 1))
+        painter.setBrush(self.BACKGROUND_HOVER if hover else self.BACKGROUND)
+        painter.drawRoundedRect(card, self.RADIUS, self.RADIUS)
+
+        text = card.adjusted(14, 12, -14, -12)
+        lines = (
+            (self._title_font, self.TITLE, tournament.name),
+            (self._format_font, self.FORMAT, tournament.format),
+            (self._meta_font, self.META, f"{tournament.date} • {tournament.player_count} joueurs"),
+        )
+
+        # === NOM / FORMAT / DATE • JOUEURS ===
+        y = text.top()
+        for font, color, value in lines:
+            painter.setFont(font)
+            painter.setPen(color)
+            metrics = painter.fontMetrics()
+            elided = metrics.elidedText(value, Qt.ElideRight, text.width())
+            painter.drawText(
+                QRect(text.left(), y, text.width(), metrics.height()),
+                Qt.AlignLeft | Qt.AlignVCenter,
+                elided,
+            )
+            y += metrics.height() + 6
+
+        painter.restore()
+
+
+# =========================
+# VUE
+# =========================
+
+class TournamentListView(QListView):
+    """
+    Liste virtualisée des tournois : seules les lignes visibles sont peintes.
+    Même menu clic droit et même glisser vers Launch que les cartes
+    widgets qu'elle remplace.
+    """
+
+    request_edit = Signal(Tournament)
+    request_launch = Signal(Tournament)
+    request_delete = Signal(Tournament)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        # État externe (fourni par UpcomingView)
+        self.launch_available: bool = True
+
+        self._drag_start_pos: QPoint | None = None
+        self._drag_index = QModelIndex()
+
+        self.setObjectName("UpcomingList")
+        self.setItemDelegate(TournamentCardDelegate(self))
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setFrameShape(QListView.NoFrame)
+        self.setMouseTracking(True)
+        self.viewport().setCursor(Qt.PointingHandCursor)
+
+    # =========================
+    # Context menu (clic droit)
+    # =========================
+    def contextMenuEvent(self, event):
+        index = self.indexAt(event.pos())
+        if not index.isValid():
+            return
+
+        tournament = self.model().tournament(index)
+        menu = QMenu(self)
+
+        edit_action = menu.addAction("✏️ Modifier le tournoi")
+        menu.addSeparator()
+
+        launch_action = menu.addAction("🚀 Envoyer vers Launch")
+        launch_action.setEnabled(self.launch_available)
+
+        menu.addSeparator()
+        delete_action = menu.addAction("🗑️ Supprimer le tournoi")
+
+        action = menu.exec(event.globalPos())
+
+        if action == edit_action:
+            self.request_edit.emit(tournament)
+
+        elif action == launch_action:
+            self.request_launch.emit(tournament)
+
+        elif action == delete_action:
+            self.request_delete.emit(tournament)
+
+    # =========================
+    # Drag & Drop
+    # =========================
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._drag_start_pos = event.pos()
+            self._drag_index = self.indexAt(event.pos())
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if not self._drag_start_pos or not self._drag_index.isValid():
+            return super().mouseMoveEvent(event)
+
+        if not (event.buttons() & Qt.LeftButton):
+            return super().mouseMoveEvent(event)
+
+        distance = (event.pos() - self._drag_start_pos).manhattanLength()
+        if distance < 8:
+            return
+
+        index = self._drag_index
+        self._drag_start_pos = None
+        self._drag_index = QModelIndex()
+        self._start_drag(index)
+
+    def _start_drag(self, index):
+        drag = QDrag(self)
+        drag.setMimeData(self.model().mimeData([index]))
+
+        pixmap = self._card_pixmap(index)
+        drag.setPixmap(pixmap)
+        drag.setHotSpot(pixmap.rect().center())
+
+        drag.exec(Qt.MoveAction)
+
+    def _card_pixmap(self, index) -> QPixmap:
+        rect = self.visualRect(index)
+        pixmap = QPixmap(rect.size())
+        pixmap.fill(Qt.transparent)
+
+        option = QStyleOptionViewItem()
+        option.initFrom(self)
+        option.rect = QRect(QPoint(0, 0), rect.size())
+
+        painter = QPainter(pixmap)
+        self.itemDelegate().paint(painter, option, index)
+        painter.end()
+        return pixmap
@@ -0,0 +1,293 @@
+"""
+designs.py
+
+Plans de tables « sans re-match » précalculés (problème du golfeur social).
+
+Pour certains nombres de joueurs, des structures combinatoires connues
+donnent plusieurs rounds consécutifs de tables de 4 où personne ne
+retrouve un ancien adversaire :
+- 16 joueurs : plan affine AG(2, 4), 5 rounds
+- 28 joueurs : unital hermitien de PG(2, 9), résoluble en 9 rounds
+- autres comptes : recherche aléatoire avec retour arrière
+
+Le calcul se fait hors ligne (python designs.py) et le résultat est
+livré dans pod_designs.json : pour chaque nombre de joueurs, la liste
+des rounds, chaque round étant la suite des places (tables de 4
+consécutives).
+"""
+
+import itertools
+import json
+import random
+import sys
+import time
+from functools import lru_cache
+from pathlib import Path
+
+
+CACHE_FILE = Path(__file__).with_name("pod_designs.json")
+
+DESIGN_TABLE_SIZE = 4
+
+# Nombres de joueurs calculés par `python designs.py`
+DESIGN_PLAYER_COUNTS = (16, 20, 24, 28, 32, 36, 40)
+
+# Plans issus d'une construction : leur nombre de rounds est le maximum
+# réel. Les autres viennent d'une recherche limitée en temps et ne sont
+# qu'une borne basse.
+CONSTRUCTED_PLAYER_COUNTS = (16, 28)
+
+
+# =========================
+# LECTURE DU CACHE
+# =========================
+
+@lru_cache(maxsize=None)
+def _designs():
+    if not CACHE_FILE.exists():
+        return {}
+
+    with open(CACHE_FILE, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+
+    return {int(count): rounds for count, rounds in raw.items()}
+
+
+def clean_rounds(player_count):
+    """Nombre de rounds sans re-match disponibles pour ce nombre de joueurs (0 si aucun plan)."""
+    return len(_designs().get(player_count, ()))
+
+
+def exact_clean_rounds(player_count):
+    """Comme clean_rounds, mais seulement pour un plan construit (0 sinon)."""
+    if player_count not in CONSTRUCTED_PLAYER_COUNTS:
+        return 0
+    return clean_rounds(player_count)
+
+
+def design_round(player_count, round_index):
+    """
+    Tables du round `round_index` (0 = premier) du plan, en indices de 0
+    à player_count - 1, ou None si aucun plan ne couvre ce round.
+    """
+    rounds = _designs().get(player_count)
+    if not rounds or round_index >= len(rounds):
+        return None
+
+    seats = rounds[round_index]
+    return [
+        seats[i:i + DESIGN_TABLE_SIZE]
+        for i in range(0, len(seats), DESIGN_TABLE_SIZE)
+    ]
+
+
+# =========================
+# CONSTRUCTIONS
+# =========================
+
+def _gf4_mul(a, b):
+    """Produit dans GF(4) = GF(2)[x] / (x² + x + 1)."""
+    result = 0
+    for _ in range(2):
+        if b & 1:
+            result ^= a
+        b >>= 1
+        a <<= 1
+        if a & 0b100:
+            a ^= 0b111
+    return result
+
+
+def affine_plane_16():
+    """Plan affine AG(2, 4) : 5 classes parallèles de 4 droites de 4 points."""
+    rounds = []
+    for slope in range(4):
+        rounds.append([
+            [x * 4 + (_gf4_mul(slope, x) ^ b) for x in range(4)]
+            for b in range(4)
+        ])
+    rounds.append([[x * 4 + y for y in range(4)] for x in range(4)])
+    return rounds
+
+
+def _gf9_mul(x, y):
+    """Produit dans GF(9) = GF(3)[i] / (i² + 1), éléments (a, b) = a + b·i."""
+    return ((x[0] * y[0] - x[1] * y[1]) % 3, (x[0] * y[1] + x[1] * y[0]) % 3)
+
+
+def _gf9_add(x, y):
+    return ((x[0] + y[0]) % 3, (x[1] + y[1]) % 3)
+
+
+def hermitian_unital_28():
+    """
+    Unital hermitien x⁴ + y⁴ + z⁴ = 0 dans PG(2, 9) : 28 points,
+    63 blocs de 4 (les sécantes), partagés ici en 9 classes parallèles.
+    """
+    field = [(a, b) for a in range(3) for b in range(3)]
+    zero, one = (0, 0), (1, 0)
+    inverse = {x: y for x in field for y in field if _gf9_mul(x, y) == one}
+
+    def normalize(v):
+        lead = next(c for c in v if c != zero)
+        return tuple(_gf9_mul(inverse[lead], c) for c in v)
+
+    def dot(u, v):
+        total = zero
+        for a, b in zip(u, v):
+            total = _gf9_add(total, _gf9_mul(a, b))
+        return total
+
+    def fourth(x):
+        x2 = _gf9_mul(x, x)
+        return _gf9_mul(x2, x2)
+
+    projective = sorted({
+        normalize(v) for v in itertools.product(field, repeat=3)
+        if v != (zero, zero, zero)
+    })
+    points = [
+        p for p in projective
+        if _gf9_add(_gf9_add(fourth(p[0]), fourth(p[1])), fourth(p[2])) == zero
+    ]
+
+    blocks = []
+    for line in projective:
+        block = [i for i, p in enumerate(points) if dot(line, p) == zero]
+        if len(block) == 4:
+            blocks.append(block)
+
+    masks = [sum(1 << p for p in block) for block in blocks]
+    used = [False] * len(blocks)
+    full = (1 << len(points)) - 1
+
+    def covers(free, current):
+        if free == 0:
+            yield list(current)
+            return
+        lowest = (free & -free).bit_length() - 1
+        for i, mask in enumerate(masks):
+            if not used[i] and mask >> lowest & 1 and mask & free == mask:
+                used[i] = True
+                current.append(i)
+                yield from covers(free & ~mask, current)
+                current.pop()
+                used[i] = False
+
+    classes = []
+
+    def resolve():
+        if len(classes) * 7 == len(blocks):
+            return True
+        for cover in covers(full, []):
+            for i in cover:
+                used[i] = True
+            classes.append(cover)
+            if resolve():
+                return True
+            classes.pop()
+            for i in cover:
+                used[i] = False
+        return False
+
+    resolve()
+    return [[blocks[i] for i in cover] for cover in classes]
+
+
+# =========================
+# RECHERCHE
+# =========================
+
+def _search_round(count, met, rng, node_limit):
+    """Un round complet de tables de 4 sans re-match, ou None."""
+    nodes = 0
+    pods = []
+
+    def fill(free):
+        nonlocal nodes
+        if free == 0:
+            return True
+        nodes += 1
+        if nodes > node_limit:
+            return False
+
+        a = (free & -free).bit_length() - 1
+        candidates = [b for b in range(count) if free >> b & 1 and b != a and not met[a] >> b & 1]
+        rng.shuffle(candidates)
+
+        for b, c, d in itertools.combinations(candidates, 3):
+            if met[b] >> c & 1 or (met[b] | met[c]) >> d & 1:
+                continue
+            pods.append([a, b, c, d])
+            if fill(free & ~(1 << a | 1 << b | 1 << c | 1 << d)):
+                return True
+            pods.pop()
+            if nodes > node_limit:
+                return False
+        return False
+
+    return list(pods) if fill((1 << count) - 1) else None
+
+
+def search_design(count, time_budget, seed=0, node_limit=20000):
+    """Enchaîne des rounds sans re-match, relance, et garde le plus long."""
+    rng = random.Random(seed)
+    best = []
+    deadline = time.monotonic() + time_budget
+
+    while time.monotonic() < deadline:
+        met = [0] * count
+        rounds = []
+        while True:
+            pods = _search_round(count, met, rng, node_limit)
+            if pods is None:
+                break
+            rounds.append(pods)
+            for pod in pods:
+                mask = sum(1 << p for p in pod)
+                for p in pod:
+                    met[p] |= mask & ~(1 << p)
+        if len(rounds) > len(best):
+            best = rounds
+
+    return best
+
+
+def check_design(count, rounds):
+    met = [0] * count
+    for pods in rounds:
+        assert sorted(p for pod in pods for p in pod) == list(range(count))
+        for pod in pods:
+            mask = sum(1 << p for p in pod)
+            for p in pod:
+                assert not met[p] & mask, "re-match dans le plan"
+            for p in pod:
+                met[p] |= mask & ~(1 << p)
+
+
+# =========================
+# GÉNÉRATION HORS LIGNE
+# =========================
+
+def build_cache(time_budget=90):
+    designs = {}
+    for count in DESIGN_PLAYER_COUNTS:
+        if count == 16:
+            rounds = affine_plane_16()
+        elif count == 28:
+            rounds = hermitian_unital_28()
+        else:
+            rounds = search_design(count, time_budget)
+
+        check_design(count, rounds)
+        designs[count] = [[p for pod in pods for p in pod] for pods in rounds]
+        print(f"{count} joueurs : {len(rounds)} rounds sans re-match")
+
+    # Une ligne par nombre de joueurs
+    lines = [f'"{count}": {json.dumps(rounds, separators=(",", ":"))}' for count, rounds in designs.items()]
+    with open(CACHE_FILE, "w", encoding="utf-8") as f:
+        f.write("{\n" + ",\n".join(lines) + "\n}\n")
+
+
+if __name__ == "__main__":
+    build_cache(float(sys.argv[1]) if len(sys.argv) > 1 else 90)
@@ -0,0 +1,91 @@
+"""
+history.py
+
+Historique des adversaires rencontrés, indexé par id de joueur.
+
+Chaque joueur possède un bitset (un int Python) : le bit j est à 1
+si le joueur a déjà partagé une table avec le joueur j.
+On garde aussi la dernière place occupée à table (ordre de jeu).
+"""
+
+
+class OpponentHistory:
+    def __init__(self):
+        self._met = []
+        self.last_seat = []
+
+    def ensure(self, player_id):
+        """Réserve une ligne vide pour chaque id jusqu'à player_id inclus."""
+        missing = player_id + 1 - len(self._met)
+        if missing > 0:
+            self._met.extend([0] * missing)
+            self.last_seat.extend([-1] * missing)
+
+    # =========================
+    # ENREGISTREMENT
+    # =========================
+
+    def record_table(self, player_ids):
+        mask = 0
+        for pid in player_ids:
+            mask |= 1 << pid
+
+        for seat, pid in enumerate(player_ids):
+            self.ensure(pid)
+            self._met[pid] |= mask & ~(1 << pid)
+            self.last_seat[pid] = seat
+
+    # =========================
+    # REQUÊTES
+    # =========================
+
+    def have_met(self, a, b):
+        if a >= len(self._met):
+            return False
+        return bool(self._met[a] >> b & 1)
+
+    def opponents_mask(self, player_id):
+        if player_id >= len(self._met):
+            return 0
+        return self._met[player_id]
+
+    def conflicts(self, player_id, mask):
+        """Nombre de joueurs de `mask` déjà rencontrés par player_id."""
+        return (self.opponents_mask(player_id) & mask).bit_count()
+
+    def rematches(self, player_ids):
+        """Nombre de paires de la table qui se sont déjà rencontrées."""
+        count = 0
+        mask = 0
+        for pid in player_ids:
+            count += self.conflicts(pid, mask)
+            mask |= 1 << pid
+        return count
+
+    # =========================
+    # SÉRIALISATION COMPACTE
+    # =========================
+
+    def pack(self, size):
+        """
+        Matrice size x size en bytes (une ligne de bits par joueur).
+        Les rencontres avec des ids >= size (joueur retiré ou exempt,
+        absent de l'appariement) sont ignorées.
+        """
+        width = (size + 7) // 8
+        keep = (1 << size) - 1
+        self.ensure(size - 1)
+        return b"".join(
+            (row & keep).to_bytes(width, "little") for row in self._met[:size]
+        )
+
+    @classmethod
+    def unpack(cls, data, size):
+        width = (size + 7) // 8
+        history = cls()
+        history._met = [
+            int.from_bytes(data[i * width:(i + 1) * width], "little")
+            for i in range(size)
+        ]
+        history.last_seat = [-1] * size
+        return history
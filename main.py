@@ -17,7 +17,7 @@ tournoie.create_tables()
 
 print(tournoie.players)
 
-result = {"Marfin": 3, "Slivoid": 2, "Le Hobbit": 1, "Chouchouuu": 1}
+result = {martin.id: 3, alexis.id: 2, gael.id: 1, audric.id: 1}
 
 tournoie.apply_result(1, result)
 
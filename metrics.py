@@ -0,0 +1,103 @@
+"""
+metrics.py
+
+Mesure de la qualité d'un appariement, en un seul passage sur les tables.
+
+C'est l'unique fonction de score du projet : la recherche locale,
+les tentatives parallèles, la simulation et le dashboard l'utilisent.
+
+Pour chaque round on compte :
+- les re-matchs (paires déjà rencontrées à la même table)
+- l'écart de score (max - min) dans chaque table
+- les tables qui mélangent plus de deux groupes de score
+- les joueurs assis à la même place qu'au round précédent
+"""
+
+from dataclasses import dataclass, field
+
+
+# Un re-match coûte autant que 10 points d'écart de score dans une table
+REMATCH_WEIGHT = 10
+
+
+@dataclass
+class PairingQuality:
+    rematches: int = 0
+    spreads: list = field(default_factory=list)
+    mixed_tables: int = 0
+    repeated_seats: int = 0
+
+    @property
+    def total_spread(self) -> int:
+        return sum(self.spreads)
+
+    @property
+    def cost(self) -> int:
+        return REMATCH_WEIGHT * self.rematches + self.total_spread
+
+
+# =========================
+# PAR TABLE
+# =========================
+
+def table_spread(ids, scores):
+    values = [scores[pid] for pid in ids]
+    return max(values) - min(values)
+
+
+def table_cost(ids, scores, history):
+    return REMATCH_WEIGHT * history.rematches(ids) + table_spread(ids, scores)
+
+
+# =========================
+# PAR ROUND
+# =========================
+
+def measure(tables, scores, history):
+    """
+    tables : listes d'ids de joueurs, une par table (dans l'ordre des places)
+    scores : score indexé par id de joueur
+    history : OpponentHistory des rounds déjà joués
+    """
+    met = history.opponents_mask
+    last_seat = history.last_seat
+    seats_known = len(last_seat)
+
+    rematches = 0
+    spreads = []
+    mixed = 0
+    repeated = 0
+
+    for ids in tables:
+        mask = 0
+        values = set()
+        for seat, pid in enumerate(ids):
+            rematches += (met(pid) & mask).bit_count()
+            mask |= 1 << pid
+            values.add(scores[pid])
+            if pid < seats_known and last_seat[pid] == seat:
+                repeated += 1
+
+        spreads.append(max(values) - min(values))
+        if len(values) > 2:
+            mixed += 1
+
+    return PairingQuality(
+        rematches=rematches,
+        spreads=spreads,
+        mixed_tables=mixed,
+        repeated_seats=repeated,
+    )
+
+
+def measure_tables(tables, history):
+    """Même mesure, directement sur des objets Table."""
+    scores = {}
+    ids = []
+    for table in tables:
+        row = []
+        for player in table.players:
+            scores[player.id] = player.score
+            row.append(player.id)
+        ids.append(row)
+    return measure(ids, scores, history)
@@ -0,0 +1,109 @@
+"""
+pairing.py
+
+Moteur d'appariement par score qui évite les re-matchs.
+
+Les joueurs sont pris dans l'ordre du classement : chaque table part du
+meilleur joueur restant (l'ancre) et se complète avec les joueurs qui
+suivent, en choisissant ceux qui ont le moins déjà rencontré la table.
+La pression de re-match du groupe de score de l'ancre
+(pairing_math.group_rematch_pressure) fixe jusqu'où on a le droit de
+descendre dans le classement pour trouver des adversaires inédits.
+"""
+
+from pairing_math import pressure_levels
+
+
+# Profondeur de recherche, en nombre de tables, selon la pression du groupe
+WINDOW_BY_PRESSURE = {
+    "low": 2,
+    "medium": 4,
+    "high": 8,
+}
+
+
+# =========================
+# GROUPES DE SCORE
+# =========================
+
+def score_group_pressures(players, sizes, rounds_played):
+    """
+    Pression de re-match de chaque groupe de score.
+
+    players : joueurs triés par score décroissant
+    sizes : tailles des tables, dans l'ordre de remplissage
+    Retourne {score: pression}.
+    """
+    # Première place de chaque table dans le classement
+    table_starts = []
+    seat = 0
+    for size in sizes:
+        table_starts.append((seat, size))
+        seat += size
+
+    scores = []
+    group_sizes = []
+    group_tables = []
+
+    start = 0
+    n = len(players)
+    while start < n:
+        score = players[start].score
+        end = start
+        while end < n and players[end].score == score:
+            end += 1
+
+        scores.append(score)
+        group_sizes.append(end - start)
+        group_tables.append(
+            [size for first, size in table_starts if start <= first < end] or [sizes[-1]]
+        )
+        start = end
+
+    # Tous les groupes en un appel (mémoïsé dans pairing_math)
+    levels = pressure_levels(group_sizes, group_tables, rounds_played)
+    return dict(zip(scores, levels))
+
+
+# =========================
+# APPARIEMENT
+# =========================
+
+def pair_by_score(players, sizes, history, rounds_played):
+    """
+    Répartit les joueurs en tables en limitant les re-matchs.
+
+    players : joueurs triés par score décroissant
+    sizes : tailles des tables, dans l'ordre de remplissage
+    history : OpponentHistory des rounds déjà joués
+    Retourne une liste de groupes de joueurs (un par table).
+    """
+    pressures = score_group_pressures(players, sizes, rounds_played)
+
+    remaining = list(players)
+    groups = []
+
+    for size in sizes:
+        anchor = remaining[0]
+        window = WINDOW_BY_PRESSURE[pressures[anchor.score]] * size
+
+        candidates = remaining[1:window + 1]
+        tail = remaining[window + 1:]
+
+        group = [anchor]
+        mask = 1 << anchor.id
+
+        for _ in range(size - 1):
+            # Moins de re-matchs d'abord, puis le plus proche au classement
+            best = min(
+                range(len(candidates)),
+                key=lambda i: (history.conflicts(candidates[i].id, mask), i)
+            )
+            player = candidates.pop(best)
+            group.append(player)
+            mask |= 1 << player.id
+
+        groups.append(group)
+        remaining = candidates + tail
+
+    return groups
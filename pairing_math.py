@@ -5,6 +5,11 @@ Analyse mathématique des risques de re-match
 pour tournois multi-joueurs (tables de 3 / 4).
 """
 
+from functools import lru_cache
+from math import comb, exp
+
+from designs import DESIGN_TABLE_SIZE, exact_clean_rounds
+
 
 # =========================
 # BASES
@@ -19,9 +24,61 @@ def average_opponents_per_round(table_sizes):
 def max_clean_rounds(group_size, avg_opponents):
     if group_size <= 1 or avg_opponents <= 0:
         return 0.0
+
+    # Tables de 4 uniquement : un plan construit donne le nombre réel
+    # (les plans trouvés par recherche ne sont qu'une borne basse)
+    if avg_opponents == DESIGN_TABLE_SIZE - 1:
+        rounds = exact_clean_rounds(group_size)
+        if rounds:
+            return float(rounds)
+
     return (group_size - 1) / avg_opponents
 
 
+# =========================
+# PROBABILITÉS (appariement aléatoire)
+# =========================
+
+def pair_meeting_probability(table_sizes):
+    """
+    Probabilité exacte que deux joueurs donnés partagent une table
+    sur un round tiré au hasard (tables de 3 / 4 mélangées comprises).
+    """
+    n = sum(table_sizes)
+    if n <= 1:
+        return 0.0
+    return sum(s * (s - 1) for s in table_sizes) / (n * (n - 1))
+
+
+def expected_rematches(table_sizes, round_number):
+    """
+    Espérance exacte du nombre de paires déjà rencontrées qui se
+    retrouvent à la même table au round `round_number` (1 = premier),
+    si chaque round est tiré au hasard indépendamment.
+    """
+    n = sum(table_sizes)
+    q = pair_meeting_probability(table_sizes)
+    return comb(n, 2) * q * (1 - (1 - q) ** (round_number - 1))
+
+
+def rematch_probability(table_sizes, round_number):
+    """Probabilité d'au moins un re-match dans le round (approximation de Poisson)."""
+    return 1 - exp(-expected_rematches(table_sizes, round_number))
+
+
+def player_rematch_probability(player_count, table_size, opponents_met):
+    """
+    Probabilité exacte qu'un joueur retrouve au moins un ancien adversaire,
+    assis au hasard à une table de `table_size` (loi hypergéométrique).
+    """
+    others = player_count - 1
+    seats = table_size - 1
+    fresh = others - opponents_met
+    if seats > others:
+        return 1.0
+    return 1 - comb(fresh, seats) / comb(others, seats)
+
+
 # =========================
 # ANALYSE DE GROUPE
 # =========================
@@ -49,25 +106,54 @@ def group_rematch_pressure(group_size, table_sizes, current_round, safety_margin
 
 
 # =========================
-# ANALYSE GLOBALE
+# ANALYSE PAR LOT (tous les groupes d'un coup)
 # =========================
 
-def tournament_pairing_diagnostic(score_groups, table_sizes_by_group, current_round):
-    details = {}
-    pressures = []
+@lru_cache(maxsize=4096)
+def _cached_pressure(group_size, table_sizes, current_round, safety_margin):
+    """table_sizes : tuple trié, la pression ne dépend que du multiset."""
+    return group_rematch_pressure(group_size, table_sizes, current_round, safety_margin)
+
+
+def group_pressures(group_sizes, table_sizes_by_group, current_round, safety_margin=1):
+    """
+    Pression de re-match de tous les groupes en un appel.
+
+    group_sizes : tailles des groupes de score
+    table_sizes_by_group : pour chaque groupe, les tailles de ses tables
+    Retourne la liste des diagnostics, dans le même ordre.
 
-    for score, players in score_groups.items():
-        group_size = len(players)
-        table_sizes = table_sizes_by_group.get(score, [])
+    Mémoïsé sur (taille du groupe, multiset des tables, round) :
+    après un résultat, seuls les groupes qui ont changé sont recalculés.
+    """
+    return [
+        dict(_cached_pressure(size, tuple(sorted(tables)), current_round, safety_margin))
+        for size, tables in zip(group_sizes, table_sizes_by_group)
+    ]
 
-        diag = group_rematch_pressure(
-            group_size=group_size,
-            table_sizes=table_sizes,
-            current_round=current_round
-        )
 
-        details[score] = diag
-        pressures.append(diag["pressure"])
+def pressure_levels(group_sizes, table_sizes_by_group, current_round, safety_margin=1):
+    """Comme group_pressures, mais seulement les niveaux ("low" / "medium" / "high")."""
+    return [
+        diag["pressure"]
+        for diag in group_pressures(group_sizes, table_sizes_by_group, current_round, safety_margin)
+    ]
+
+
+# =========================
+# ANALYSE GLOBALE
+# =========================
+
+def tournament_pairing_diagnostic(score_groups, table_sizes_by_group, current_round):
+    scores = list(score_groups)
+    diags = group_pressures(
+        [len(score_groups[score]) for score in scores],
+        [table_sizes_by_group.get(score, []) for score in scores],
+        current_round
+    )
+
+    details = dict(zip(scores, diags))
+    pressures = [diag["pressure"] for diag in diags]
 
     if "high" in pressures:
         global_pressure = "high"
@@ -0,0 +1,80 @@
+"""
+pairing_restarts.py
+
+Appariements aléatoires indépendants, répartis sur un pool de processus.
+
+Chaque tentative mélange les joueurs avec sa propre graine, découpe les
+tables et se note avec les mêmes critères que la recherche locale
+(re-matchs, écart de score). On garde la meilleure.
+
+Les workers ne reçoivent que des entiers : ids des joueurs, scores
+indexés par id et la matrice d'historique compactée en bytes, envoyés
+une seule fois par processus.
+"""
+
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from history import OpponentHistory
+from metrics import measure
+
+
+# État d'un worker, fixé une fois par _init_worker
+_IDS = ()
+_SIZES = ()
+_SCORES = ()
+_HISTORY = None
+
+
+def _init_worker(ids, sizes, scores, packed_history):
+    global _IDS, _SIZES, _SCORES, _HISTORY
+    _IDS = ids
+    _SIZES = sizes
+    _SCORES = scores
+    _HISTORY = OpponentHistory.unpack(packed_history, len(scores))
+
+
+def _attempt(seed):
+    order = list(_IDS)
+    random.Random(seed).shuffle(order)
+
+    tables = []
+    idx = 0
+    for size in _SIZES:
+        tables.append(order[idx:idx + size])
+        idx += size
+
+    return measure(tables, _SCORES, _HISTORY).cost, seed, tables
+
+
+def best_random_pairing(players, sizes, history, attempts, workers=None, seed=None):
+    """
+    Lance `attempts` appariements aléatoires sur `workers` processus
+    (un par cœur par défaut) et retourne les groupes de joueurs du meilleur.
+    """
+    by_id = {p.id: p for p in players}
+    size = max(by_id) + 1
+
+    scores = [0] * size
+    for pid, player in by_id.items():
+        scores[pid] = player.score
+
+    ids = tuple(by_id)
+    sizes = tuple(sizes)
+    initargs = (ids, sizes, tuple(scores), history.pack(size))
+
+    workers = workers or os.cpu_count() or 1
+    base = random.Random(seed).randrange(2 ** 32)
+    seeds = range(base, base + attempts)
+    chunksize = max(1, attempts // (workers * 4))
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=initargs,
+    ) as pool:
+        # Départage à coût égal par la graine : résultat reproductible
+        _, _, tables = min(pool.map(_attempt, seeds, chunksize=chunksize))
+
+    return [[by_id[pid] for pid in table] for table in tables]
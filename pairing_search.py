@@ -0,0 +1,175 @@
+"""
+pairing_search.py
+
+Recherche « anytime » sur un appariement déjà construit
+(typiquement celui de create_tables_by_score).
+
+La recherche échange des joueurs entre tables voisines (recuit simulé)
+et garde toujours la meilleure répartition trouvée : on peut l'arrêter
+à tout moment, à l'échéance ou sur annulation, et repartir avec un
+résultat valide.
+"""
+
+import math
+import random
+import threading
+import time
+
+from metrics import measure, table_cost
+
+
+# Les échanges se font entre tables distantes d'au plus 2 rangs
+NEIGHBOUR_TABLES = 2
+
+# Fréquence (en itérations) des contrôles d'échéance / d'annulation
+CHECK_EVERY = 256
+
+
+# =========================
+# RECHERCHE
+# =========================
+
+class PairingSearch:
+    def __init__(self, groups, history, seed=None, temperature=2.0):
+        """
+        groups : groupes de joueurs (un par table), point de départ
+        history : OpponentHistory des rounds déjà joués
+        """
+        self._history = history
+        self._players = {p.id: p for group in groups for p in group}
+
+        size = max(self._players, default=-1) + 1
+        self._scores = [0] * size
+        for pid, player in self._players.items():
+            self._scores[pid] = player.score
+
+        self._tables = [[p.id for p in group] for group in groups]
+        self._costs = [table_cost(t, self._scores, history) for t in self._tables]
+        self._cost = sum(self._costs)
+
+        self._best_tables = [list(t) for t in self._tables]
+        self._best_cost = self._cost
+
+        self._rng = random.Random(seed)
+        self._temperature = temperature
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+        self.iterations = 0
+
+    # =========================
+    # CONTRÔLE
+    # =========================
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def best(self):
+        """Retourne (groupes de joueurs, PairingQuality) du meilleur état."""
+        with self._lock:
+            tables = [list(t) for t in self._best_tables]
+
+        groups = [[self._players[pid] for pid in t] for t in tables]
+        return groups, measure(tables, self._scores, self._history)
+
+    # =========================
+    # EXÉCUTION
+    # =========================
+
+    def run(self, time_budget=None, on_improve=None):
+        """
+        Améliore l'appariement jusqu'à l'échéance (en secondes)
+        ou jusqu'à cancel(). Sans échéance, tourne jusqu'à cancel().
+
+        on_improve(quality) est appelé après chaque lot d'itérations qui a
+        trouvé un meilleur état, depuis le thread de la recherche.
+        """
+        start = time.monotonic()
+        deadline = None if time_budget is None else start + time_budget
+        temperature = self._temperature
+
+        while len(self._tables) > 1:
+            # Meilleur état relevé pas à pas : le recuit peut en repartir
+            # avant la fin du lot
+            improved = False
+            for _ in range(CHECK_EVERY):
+                if self._step(temperature) and self._cost < self._best_cost:
+                    self._keep_best()
+                    improved = True
+            self.iterations += CHECK_EVERY
+
+            if improved and on_improve:
+                with self._lock:
+                    tables = [list(t) for t in self._best_tables]
+                on_improve(measure(tables, self._scores, self._history))
+
+            if self.cancelled:
+                break
+
+            now = time.monotonic()
+            if deadline is not None:
+                if now >= deadline:
+                    break
+                # Refroidissement linéaire sur le budget
+                temperature = self._temperature * (deadline - now) / time_budget
+            else:
+                temperature = 0.0
+
+        return self.best()
+
+    def start(self, time_budget=None, on_improve=None):
+        """Lance run() dans un thread de fond."""
+        self._thread = threading.Thread(
+            target=self.run,
+            args=(time_budget, on_improve),
+            daemon=True,
+        )
+        self._thread.start()
+        return self._thread
+
+    def join(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _keep_best(self):
+        with self._lock:
+            self._best_tables = [list(t) for t in self._tables]
+            self._best_cost = self._cost
+
+    def _step(self, temperature):
+        """Tente un échange ; retourne True s'il est accepté."""
+        tables = self._tables
+        a = self._rng.randrange(len(tables))
+        b = a + self._rng.randint(-NEIGHBOUR_TABLES, NEIGHBOUR_TABLES)
+        if b == a or not 0 <= b < len(tables):
+            return False
+
+        ta, tb = tables[a], tables[b]
+        i = self._rng.randrange(len(ta))
+        j = self._rng.randrange(len(tb))
+
+        ta[i], tb[j] = tb[j], ta[i]
+        cost_a = table_cost(ta, self._scores, self._history)
+        cost_b = table_cost(tb, self._scores, self._history)
+        delta = cost_a + cost_b - self._costs[a] - self._costs[b]
+
+        if delta <= 0 or (
+            temperature > 0
+            and self._rng.random() < math.exp(-delta / temperature)
+        ):
+            self._costs[a] = cost_a
+            self._costs[b] = cost_b
+            self._cost += delta
+            return True
+
+        ta[i], tb[j] = tb[j], ta[i]
+        return False
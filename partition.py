@@ -0,0 +1,108 @@
+"""
+partition.py
+
+Découpage d'un nombre de joueurs en tables.
+
+Un seul solveur pour tout le projet : tirage aléatoire, tirage par score
+et aperçu dans l'interface donnent la même répartition.
+
+On minimise le nombre de tables qui ne sont pas à la taille préférée
+(4 par défaut : on préfère 4+4+4 à 3+3+3+3). Les résultats sont gardés
+dans une table par configuration, étendue au besoin : chaque lookup est
+en O(1) une fois calculé.
+"""
+
+from functools import lru_cache
+
+
+DEFAULT_SIZES = (3, 4)
+
+
+class _Solver:
+    def __init__(self, allowed, preferred):
+        self.allowed = tuple(sorted(set(allowed), reverse=True))
+        self.preferred = preferred
+
+        # cost[i] : nombre minimal de tables hors taille préférée pour i joueurs
+        # (None si impossible), last[i] : taille de la dernière table posée
+        self._cost = [0]
+        self._last = [0]
+
+    def _extend(self, n):
+        cost, last = self._cost, self._last
+        for i in range(len(cost), n + 1):
+            best = None
+            best_size = 0
+            for size in self.allowed:
+                if size > i or cost[i - size] is None:
+                    continue
+                c = cost[i - size] + (size != self.preferred)
+                if best is None or c < best:
+                    best, best_size = c, size
+            cost.append(best)
+            last.append(best_size)
+
+    def feasible(self, n):
+        self._extend(n)
+        return self._cost[n] is not None
+
+    def sizes(self, n):
+        self._extend(n)
+        sizes = []
+        while n > 0:
+            size = self._last[n]
+            sizes.append(size)
+            n -= size
+        sizes.sort(reverse=True)
+        return tuple(sizes)
+
+
+_SOLVERS = {}
+
+
+def _solver(allowed, preferred):
+    key = (tuple(allowed), preferred)
+    solver = _SOLVERS.get(key)
+    if solver is None:
+        solver = _SOLVERS[key] = _Solver(allowed, preferred)
+    return solver
+
+
+# =========================
+# API
+# =========================
+
+@lru_cache(maxsize=None)
+def table_sizes(player_count, allowed=DEFAULT_SIZES, preferred=None, byes=False):
+    """
+    Tailles des tables (décroissantes) pour player_count joueurs.
+
+    allowed : tailles autorisées, ex. (2,) pour le Duel Commander,
+              (3, 4, 5) pour des parties casual
+    preferred : taille visée (la plus grande autorisée par défaut)
+    byes : si la répartition exacte est impossible, laisse le minimum
+           de joueurs sans table plutôt que de lever une erreur
+    """
+    solver = _solver(allowed, preferred or max(allowed))
+
+    seated = player_count
+    if byes:
+        while seated > 0 and not solver.feasible(seated):
+            seated -= 1
+
+    if seated == 0 or not solver.feasible(seated):
+        raise ValueError(f"Répartition impossible pour {player_count} joueur(s).")
+
+    return solver.sizes(seated)
+
+
+def bye_count(player_count, allowed=DEFAULT_SIZES, preferred=None, byes=False):
+    return player_count - sum(table_sizes(player_count, allowed, preferred, byes))
+
+
+def table_count(player_count, allowed=DEFAULT_SIZES, preferred=None, byes=False):
+    """Nombre de tables, 0 si la répartition est impossible."""
+    try:
+        return len(table_sizes(player_count, allowed, preferred, byes))
+    except ValueError:
+        return 0
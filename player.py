@@ -1,8 +1,70 @@
+import sys
+
+
 class Player:
+	"""
+	Joueur. Une fois inscrit dans un tournoi, ce n'est plus qu'une vue
+	sur sa ligne du PlayerStore : nom et score sont lus dans les colonnes.
+	"""
+
+	__slots__ = ("id", "_store", "_name", "_score", "_tables_played")
+
 	def __init__(self, name):
-		self.name = name
-		self.score = 0
-		self.tables_played = []
+		self.id = None
+		self._store = None
+		self._name = name
+		self._score = 0
+		self._tables_played = []
+
+	def attach(self, store):
+		"""Range le joueur dans `store`, qui devient la source de vérité."""
+		self.id = store.add(self._name, self._score, self._tables_played)
+		self._store = store
+		return self.id
+
+	@property
+	def name(self):
+		if self._store is None:
+			return self._name
+		return self._store.names[self.id]
+
+	@name.setter
+	def name(self, value):
+		if self._store is None:
+			self._name = value
+		else:
+			self._store.names[self.id] = sys.intern(value)
+
+	@property
+	def score(self):
+		if self._store is None:
+			return self._score
+		# Colonne en flottants : un score entier reste un int, comme avant
+		score = self._store.scores[self.id]
+		return int(score) if score.is_integer() else score
+
+	@score.setter
+	def score(self, value):
+		if self._store is None:
+			self._score = value
+		else:
+			self._store.scores[self.id] = value
+
+	@property
+	def tables_played(self):
+		if self._store is None:
+			return self._tables_played
+		return self._store.tables_played[self.id]
+
+	@tables_played.setter
+	def tables_played(self, value):
+		if self._store is None:
+			self._tables_played = value
+		else:
+			self._store.tables_played[self.id] = value
 
 	def add_score(self, point):
-		self.score += point
\ No newline at end of file
+		if self._store is None:
+			self._score += point
+		else:
+			self._store.scores[self.id] += point
\ No newline at end of file
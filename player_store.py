@@ -0,0 +1,43 @@
+"""
+player_store.py
+
+Stockage des joueurs en colonnes, pour les grosses ligues.
+
+Une colonne par attribut (nom interné, score, tables jouées), indexée
+par l'id du joueur. Les objets Player ne sont que des vues légères sur
+une ligne de ce stockage.
+"""
+
+import sys
+from array import array
+from itertools import groupby
+
+
+class PlayerStore:
+    def __init__(self):
+        self.names = []
+        # Flottants : les points d'une table ne sont pas forcément entiers
+        self.scores = array("d")
+        self.tables_played = []
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, name, score=0, tables_played=None):
+        """Ajoute une ligne et retourne l'id du joueur."""
+        player_id = len(self.names)
+        self.names.append(sys.intern(name))
+        self.scores.append(score)
+        self.tables_played.append(tables_played if tables_played is not None else [])
+        return player_id
+
+    # =========================
+    # OPÉRATIONS EN COLONNES
+    # =========================
+
+    def score_groups(self, ordered_ids):
+        """[(score, [ids])] pour des ids déjà triés par score."""
+        return [
+            (score, list(ids))
+            for score, ids in groupby(ordered_ids, key=self.scores.__getitem__)
+        ]
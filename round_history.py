@@ -0,0 +1,112 @@
+"""
+round_history.py
+
+Historique des rounds joués d'un tournoi, conservé d'un round à l'autre.
+
+Stockage en colonnes (array) :
+- une ligne par table jouée : round, numéro de table, début et taille
+  de sa plage de places
+- une ligne par place : id du joueur et points marqués (vecteur de résultat)
+- par joueur, les lignes des tables qu'il a jouées
+
+« A et B se sont-ils rencontrés ? » reste en O(1) via OpponentHistory,
+la liste des matchs d'un joueur se lit en O(rounds).
+"""
+
+from array import array
+
+from history import OpponentHistory
+
+
+class RoundHistory:
+    def __init__(self, opponents=None):
+        # Colonnes par table
+        self._round = array("l")
+        self._table = array("l")
+        self._start = array("l")
+        self._size = array("l")
+
+        # Colonnes par place
+        self._players = array("l")
+        self._points = array("d")
+
+        # Lignes de table jouées, par id de joueur
+        self._rows_of = []
+
+        self.opponents = opponents if opponents is not None else OpponentHistory()
+
+    def __len__(self):
+        return len(self._round)
+
+    # =========================
+    # ENREGISTREMENT
+    # =========================
+
+    def record_table(self, round_number, table_id, player_ids, points):
+        """
+        player_ids : ids dans l'ordre des places à la table
+        points : points marqués, dans le même ordre
+        """
+        # Conversion avant toute écriture : une valeur refusée
+        # ne laisse pas de ligne à moitié enregistrée
+        ids = array("l", player_ids)
+        points = array("d", points)
+        if len(points) != len(ids):
+            raise ValueError("Un résultat par joueur attendu.")
+
+        row = len(self._round)
+        self._players.extend(ids)
+        self._points.extend(points)
+
+        self._round.append(round_number)
+        self._table.append(table_id)
+        self._start.append(len(self._players) - len(ids))
+        self._size.append(len(ids))
+
+        for pid in player_ids:
+            missing = pid + 1 - len(self._rows_of)
+            if missing > 0:
+                self._rows_of.extend(array("l") for _ in range(missing))
+            self._rows_of[pid].append(row)
+
+        self.opponents.record_table(player_ids)
+        return row
+
+    # =========================
+    # REQUÊTES
+    # =========================
+
+    def have_met(self, a, b):
+        return self.opponents.have_met(a, b)
+
+    def table(self, row):
+        """(round, numéro de table, ids des joueurs, points) d'une table jouée."""
+        start = self._start[row]
+        end = start + self._size[row]
+        return (
+            self._round[row],
+            self._table[row],
+            self._players[start:end].tolist(),
+            self._points[start:end].tolist(),
+        )
+
+    def round_tables(self, round_number):
+        """Lignes des tables jouées au round donné."""
+        return [row for row, r in enumerate(self._round) if r == round_number]
+
+    def player_matches(self, player_id):
+        """
+        [(round, numéro de table, place au classement de la table)]
+        dans l'ordre joué. Les ex-aequo partagent la même place.
+        """
+        if player_id >= len(self._rows_of):
+            return []
+
+        matches = []
+        for row in self._rows_of[player_id]:
+            start = self._start[row]
+            points = self._points[start:start + self._size[row]]
+            mine = points[self._players[start:start + self._size[row]].index(player_id)]
+            place = 1 + sum(1 for p in points if p > mine)
+            matches.append((self._round[row], self._table[row], place))
+        return matches
@@ -0,0 +1,117 @@
+"""
+simulation.py
+
+Monte Carlo : rejoue des milliers de tournois synthétiques à travers
+le vrai code d'appariement (Tournament) et compare les re-matchs
+observés au modèle de pairing_math.
+
+Les tournois sont répartis sur un pool de processus (un par cœur).
+
+    python simulation.py            # 64, 128 et 512 joueurs
+    python simulation.py 96 5 500   # joueurs, rounds, tournois
+    python simulation.py 96 5 500 random   # tirage aléatoire (create_tables)
+"""
+
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from pairing_math import expected_rematches, rematch_probability
+from partition import table_sizes
+from player import Player
+from tournament import Tournament
+
+
+# Points selon la place à la table (1er, 2e, puis 0)
+PLACE_POINTS = (3, 1)
+
+
+# =========================
+# UN TOURNOI
+# =========================
+
+def simulate_tournament(player_count, rounds, seed, mode="score"):
+    """
+    Joue un tournoi aux résultats aléatoires.
+    Retourne le nombre de paires re-jouées à chaque round.
+    """
+    random.seed(seed)
+
+    tournament = Tournament()
+    for i in range(player_count):
+        tournament.add_player(Player(f"J{i}"))
+
+    rematches = []
+    for _ in range(rounds):
+        if mode == "score":
+            tournament.create_tables_by_score()
+        else:
+            tournament.create_tables()
+
+        rematches.append(tournament.pairing_metrics().rematches)
+
+        batch = []
+        for table in tournament.tables:
+            order = random.sample(table.players, len(table.players))
+            batch.append((table.id, {
+                p.id: PLACE_POINTS[place] if place < len(PLACE_POINTS) else 0
+                for place, p in enumerate(order)
+            }))
+        tournament.apply_results(batch)
+
+    return rematches
+
+
+def _simulate(args):
+    return simulate_tournament(*args)
+
+
+# =========================
+# CAMPAGNE
+# =========================
+
+def run(player_count, rounds, trials, mode="score", workers=None, seed=0):
+    """
+    Retourne, pour chaque round, le prédit (appariement aléatoire)
+    et l'observé (moyenne des re-matchs, part des tournois touchés).
+    """
+    tasks = [(player_count, rounds, seed + i, mode) for i in range(trials)]
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        runs = list(pool.map(_simulate, tasks, chunksize=max(1, trials // (workers * 4))))
+
+    sizes = table_sizes(player_count)
+    report = []
+    for r in range(rounds):
+        observed = [counts[r] for counts in runs]
+        report.append({
+            "round": r + 1,
+            "predicted_rematches": round(expected_rematches(sizes, r + 1), 2),
+            "predicted_probability": round(rematch_probability(sizes, r + 1), 3),
+            "observed_rematches": round(sum(observed) / trials, 2),
+            "observed_probability": round(sum(1 for c in observed if c) / trials, 3),
+        })
+    return report
+
+
+def print_report(player_count, rounds, trials, mode="score"):
+    print(f"\n{player_count} joueurs, {rounds} rounds, {trials} tournois ({mode})")
+    print("round | prédit (aléatoire) | observé | P(re-match) prédit / observé")
+    for row in run(player_count, rounds, trials, mode):
+        print(
+            f"{row['round']:>5} | {row['predicted_rematches']:>18} | "
+            f"{row['observed_rematches']:>7} | "
+            f"{row['predicted_probability']} / {row['observed_probability']}"
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        count, rounds, trials = (int(a) for a in sys.argv[1:4])
+        mode = sys.argv[4] if len(sys.argv) > 4 else "score"
+        print_report(count, rounds, trials, mode)
+    else:
+        for count in (64, 128, 512):
+            print_report(count, 6, 1000)
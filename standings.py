@@ -0,0 +1,94 @@
+"""
+standings.py
+
+Classement tenu à jour au fil des résultats.
+
+Les joueurs sont rangés par clé de tri (score puis départages, en
+négatif pour un tri croissant, et l'id pour finir) dans une liste triée.
+Un résultat ne repositionne que les joueurs de la table : la recherche
+se fait par bisection, sans retrier tout le classement.
+"""
+
+from bisect import bisect_left, insort
+
+
+# Au-delà de cette part du classement modifiée, un tri complet est plus rapide
+REBUILD_RATIO = 0.125
+
+
+class Standings:
+    def __init__(self):
+        self._keys = {}
+        self._order = []
+        self._previous = {}
+
+    def __len__(self):
+        return len(self._order)
+
+    # =========================
+    # MISE À JOUR
+    # =========================
+
+    def add(self, player_id, key):
+        self._keys[player_id] = key
+        insort(self._order, key)
+
+    def update(self, player_id, key):
+        old = self._keys[player_id]
+        if old == key:
+            return
+        del self._order[bisect_left(self._order, old)]
+        self._keys[player_id] = key
+        insort(self._order, key)
+
+    def update_many(self, keys):
+        """keys : {player_id: clé}, appliquées en un seul passage."""
+        if len(keys) > len(self._order) * REBUILD_RATIO:
+            self._keys.update(keys)
+            self._order = sorted(self._keys.values())
+            return
+
+        for player_id, key in keys.items():
+            self.update(player_id, key)
+
+    def close_round(self):
+        """Mémorise les rangs actuels comme référence de l'évolution."""
+        self._previous = {key[-1]: rank for rank, key in enumerate(self._order, start=1)}
+
+    # =========================
+    # REQUÊTES
+    # =========================
+
+    def rank(self, player_id):
+        return bisect_left(self._order, self._keys[player_id]) + 1
+
+    def rank_change(self, player_id):
+        """Places gagnées (positif) ou perdues depuis close_round()."""
+        previous = self._previous.get(player_id)
+        if previous is None:
+            return 0
+        return previous - self.rank(player_id)
+
+    def around(self, player_id, radius=None):
+        """
+        Ids des joueurs à au plus `radius` places (tout le classement
+        sans radius), du plus proche au plus loin. Générateur : le
+        parcours s'arrête dès que l'appelant a trouvé son voisin.
+        """
+        rank = self.rank(player_id) - 1
+        size = len(self._order)
+        if radius is None:
+            radius = size
+
+        for offset in range(1, radius + 1):
+            if rank - offset < 0 and rank + offset >= size:
+                return
+            for i in (rank - offset, rank + offset):
+                if 0 <= i < size:
+                    yield self._order[i][-1]
+
+    def top(self, n):
+        return [key[-1] for key in self._order[:n]]
+
+    def ids(self):
+        return [key[-1] for key in self._order]
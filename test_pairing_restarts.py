@@ -0,0 +1,29 @@
+from history import OpponentHistory
+from player import Player
+from tournament import Tournament
+
+
+def test_pack_ignores_ids_outside_matrix():
+	history = OpponentHistory()
+	history.record_table([0, 8])
+
+	packed = history.pack(8)
+
+	assert len(packed) == 8
+	assert not OpponentHistory.unpack(packed, 8).have_met(0, 8)
+
+
+def test_restarts_after_highest_id_dropped():
+	t = Tournament()
+	for i in range(9):
+		t.add_player(Player(f"P{i}"))
+
+	t.create_tables()
+	for table in list(t.tables):
+		t.apply_result(table.id, {p.id: k for k, p in enumerate(table.players)})
+
+	t.drop_player(8)
+	t.create_tables(attempts=4, workers=1)
+
+	seated = [p.id for table in t.tables for p in table.players]
+	assert sorted(seated) == list(range(8))
@@ -0,0 +1,110 @@
+import pytest
+
+from player import Player
+from tournament import Tournament
+
+
+def _tournament(count, **kwargs):
+	t = Tournament(**kwargs)
+	for i in range(count):
+		t.add_player(Player(f"P{i}"))
+	t.create_tables_by_score()
+	return t
+
+
+def _report(t, table):
+	t.apply_result(table.id, {p.id: k for k, p in enumerate(table.players)})
+
+
+def _seated(t):
+	return sorted(p.id for table in t.tables for p in table.players)
+
+
+def test_drop_reseats_only_its_table():
+	t = _tournament(16)
+	before = list(t.tables)
+	leaving = before[1].players[0]
+
+	t.drop_player(leaving.id)
+
+	assert [table.id for table in t.tables] == [1, 2, 3, 4]
+	assert [t.tables[i] is before[i] for i in (0, 2, 3)] == [True, True, True]
+	assert len(t.tables[1].players) == 3
+	assert leaving.id not in _seated(t)
+	assert leaving.id in t.dropped
+
+
+def test_drop_widens_to_neighbour_tables():
+	t = _tournament(17)
+	assert [len(table.players) for table in t.tables] == [4, 4, 3, 3, 3]
+	before = list(t.tables)
+
+	t.drop_player(before[3].players[0].id)
+
+	# 3 + 2 + 3 joueurs : les tables 3 à 5 deviennent deux tables de 4
+	assert t.tables[0] is before[0]
+	assert t.tables[1] is before[1]
+	assert [table.id for table in t.tables] == [1, 2, 3, 4]
+	assert [len(table.players) for table in t.tables] == [4, 4, 4, 4]
+	assert len(_seated(t)) == 16
+
+
+def test_failed_drop_changes_nothing():
+	t = _tournament(9)
+	_report(t, t.tables[0])
+	before = list(t.tables)
+	player = before[1].players[0]
+
+	with pytest.raises(ValueError):
+		t.drop_player(player.id)
+
+	assert t.tables == before
+	assert player.id not in t.dropped
+	assert player in t.players
+	assert t.get_table(t._table_of[player.id]) is before[1]
+
+
+def test_drop_twice_is_a_no_op():
+	t = _tournament(16)
+	pid = t.tables[0].players[0].id
+
+	t.drop_player(pid)
+	t.drop_player(pid)
+
+	assert len(t.players) == 15
+
+
+def test_drop_falls_back_to_a_bye():
+	t = _tournament(8, allowed_sizes=(2,), byes=True)
+
+	t.drop_player(t.tables[0].players[0].id)
+
+	assert len(_seated(t)) == 6
+	assert len(t.byes) == 1
+	bye = t.byes[0]
+	assert bye.score == t.bye_points
+	assert t.bye_rounds[bye.id] == [t.round]
+
+
+def test_late_player_is_seated_in_the_current_round():
+	t = _tournament(12)
+	late = Player("Late")
+
+	t.add_late_player(late)
+
+	assert late.id in _seated(t)
+	assert len(_seated(t)) == 13
+	assert [table.id for table in t.tables] == [1, 2, 3, 4]
+
+
+def test_byes_rotate():
+	t = Tournament(allowed_sizes=(2,), byes=True)
+	for i in range(7):
+		t.add_player(Player(f"P{i}"))
+
+	for _ in range(7):
+		t.create_tables_by_score()
+		for table in list(t.tables):
+			_report(t, table)
+
+	assert sorted(len(rounds) for rounds in t.bye_rounds.values()) == [1] * 7
@@ -0,0 +1,47 @@
+import pytest
+
+from player import Player
+from tournament import Tournament
+
+
+def _tournament(count):
+	t = Tournament()
+	for i in range(count):
+		t.add_player(Player(f"P{i}"))
+	t.create_tables_by_score()
+	return t
+
+
+def _points(table, value=None):
+	return {p.id: k if value is None else value for k, p in enumerate(table.players)}
+
+
+def test_batch_applies_every_table():
+	t = _tournament(8)
+	first, second = t.tables
+
+	t.apply_results({first.id: _points(first), second.id: _points(second)})
+
+	assert first.result and second.result
+	assert len(t.rounds) == 2
+	assert sorted(p.score for p in t.players) == [0, 0, 1, 1, 2, 2, 3, 3]
+
+
+@pytest.mark.parametrize("bad", [
+	lambda first, second: [(first.id, _points(first)), (second.id, _points(second, "x"))],
+	lambda first, second: [(first.id, _points(first)), (99, {})],
+	lambda first, second: [(first.id, _points(first)), (first.id, _points(first))],
+	lambda first, second: [(first.id, _points(first)), (second.id, {})],
+	lambda first, second: [(first.id, _points(first)), (second.id, {**_points(second), 42: 1})],
+])
+def test_invalid_batch_changes_nothing(bad):
+	t = _tournament(8)
+	first, second = t.tables
+
+	with pytest.raises(ValueError):
+		t.apply_results(bad(first, second))
+
+	assert not first.result and not second.result
+	assert len(t.rounds) == 0
+	assert all(p.score == 0 for p in t.players)
+	assert all(not p.tables_played for p in t.players)
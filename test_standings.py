@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from player import Player
+from tournament import Tournament
+
+
+def _play(t, rounds, rng):
+	for _ in range(rounds):
+		t.create_tables_by_score()
+		for table in list(t.tables):
+			t.apply_result(table.id, {p.id: rng.randint(0, 3) for p in table.players})
+
+
+def _replayed_tiebreakers(t):
+	"""Départages recalculés depuis l'historique des rounds, sans état incrémental."""
+	scores = {p.id: 0 for p in t.players}
+	opponents = {pid: [] for pid in scores}
+	pods = {pid: [] for pid in scores}
+
+	for round_number in range(1, t.round + 1):
+		for pid, rounds in t.bye_rounds.items():
+			scores[pid] += t.bye_points * rounds.count(round_number)
+
+		for row in t.rounds.round_tables(round_number):
+			_, _, ids, points = t.rounds.table(row)
+			strength = sum(scores[pid] for pid in ids) / len(ids)
+			for pid, gained in zip(ids, points):
+				opponents[pid].extend(other for other in ids if other != pid)
+				pods[pid].append(strength)
+				scores[pid] += gained
+
+	return {
+		pid: (
+			sum(scores[o] for o in opponents[pid]) / len(opponents[pid]) if opponents[pid] else 0.0,
+			sum(pods[pid]) / len(pods[pid]) if pods[pid] else 0.0,
+		)
+		for pid in scores
+	}, scores
+
+
+@pytest.mark.parametrize("count, kwargs", [
+	(13, {}),
+	(7, {"allowed_sizes": (2,), "byes": True}),
+])
+def test_incremental_standings_match_a_full_recompute(count, kwargs):
+	t = Tournament(**kwargs)
+	for i in range(count):
+		t.add_player(Player(f"P{i}"))
+	_play(t, 5, random.Random(count))
+
+	expected, scores = _replayed_tiebreakers(t)
+
+	for player in t.players:
+		assert player.score == scores[player.id]
+		assert t.tiebreakers.values(player.id) == pytest.approx(expected[player.id])
+
+	order = sorted(
+		scores,
+		key=lambda pid: (-scores[pid], -expected[pid][0], -expected[pid][1], pid),
+	)
+	assert t.standings.ids() == order
+	assert [row[1] for row in t.ranking_rows()] == order
+
@@ -0,0 +1,99 @@
+"""
+tiebreakers.py
+
+Départages tenus à jour résultat par résultat.
+
+Pour chaque joueur on garde des agrégats sur ses adversaires :
+- points adverses : somme des scores actuels de ses adversaires
+  (un adversaire rencontré deux fois compte deux fois)
+- force des tables : moyenne des scores de chaque table jouée,
+  prise au moment où elle s'est assise
+
+Quand un joueur marque des points, seuls ses adversaires passés sont
+mis à jour : le coût d'un résultat est en O(taille de table x rounds),
+sans jamais recalculer tout l'historique.
+
+Les agrégats sont rangés en colonnes (array) indexées par id de joueur,
+comme dans le PlayerStore.
+"""
+
+from array import array
+
+
+class Tiebreakers:
+    def __init__(self):
+        self._opponents = []
+        self._opponent_points = array("d")
+        self._pod_strength = array("d")
+        self._pods = array("l")
+
+    def add_player(self, player_id):
+        """Les ids sont denses : on étend les colonnes jusqu'à player_id."""
+        while len(self._opponents) <= player_id:
+            self._opponents.append(array("l"))
+            self._opponent_points.append(0)
+            self._pod_strength.append(0.0)
+            self._pods.append(0)
+
+    # =========================
+    # ENREGISTREMENT
+    # =========================
+
+    def record_table(self, players, points):
+        """
+        players : joueurs de la table, scores déjà mis à jour
+        points : {player_id: points marqués à cette table}
+        Retourne les ids des anciens adversaires dont les départages ont changé.
+        """
+        before = [p.score - points[p.id] for p in players]
+        strength = sum(before) / len(before)
+
+        # 1) Les points marqués remontent chez les anciens adversaires
+        affected = set()
+        for player in players:
+            affected |= self.add_points(player.id, points[player.id])
+
+        # 2) Nouveaux adversaires de cette table
+        for player in players:
+            pid = player.id
+            for other in players:
+                if other is not player:
+                    self._opponents[pid].append(other.id)
+                    self._opponent_points[pid] += other.score
+
+            self._pod_strength[pid] += strength
+            self._pods[pid] += 1
+
+        return affected
+
+    def add_points(self, player_id, gained):
+        """
+        Points marqués hors table (bye) : seuls les anciens adversaires
+        sont mis à jour. Retourne leurs ids.
+        """
+        affected = set()
+        for opponent_id in self._opponents[player_id]:
+            self._opponent_points[opponent_id] += gained
+            affected.add(opponent_id)
+        return affected
+
+    # =========================
+    # DÉPARTAGES
+    # =========================
+
+    def opponents_average(self, player_id):
+        """Points moyens des adversaires rencontrés."""
+        count = len(self._opponents[player_id])
+        if not count:
+            return 0.0
+        return self._opponent_points[player_id] / count
+
+    def pods_strength(self, player_id):
+        """Score moyen des tables jouées, au moment de s'y asseoir."""
+        pods = self._pods[player_id]
+        if not pods:
+            return 0.0
+        return self._pod_strength[player_id] / pods
+
+    def values(self, player_id):
+        return (self.opponents_average(player_id), self.pods_strength(player_id))
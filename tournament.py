@@ -1,106 +1,420 @@
 from player import Player
+from player_store import PlayerStore
 from table import Table
+from history import OpponentHistory
+from round_history import RoundHistory
+from pairing import pair_by_score, score_group_pressures
+from pairing_search import PairingSearch
+from pairing_restarts import best_random_pairing
+from metrics import measure_tables
+from partition import DEFAULT_SIZES, table_sizes
+from standings import Standings
+from designs import DESIGN_TABLE_SIZE, design_round
+from tiebreakers import Tiebreakers
+from bisect import bisect_left
+from numbers import Real
 import random
 
 class Tournament:
-	def __init__(self):
+	def __init__(self, allowed_sizes=DEFAULT_SIZES, byes=False, bye_points=3):
+		self.store = PlayerStore()
 		self.players = []
 		self.tables = []
+		self.byes = []
+		self.dropped = set()
+		self._players_by_id = {}
+		self._tables_by_id = {}
+		self._table_of = {}
+		self.allowed_sizes = tuple(allowed_sizes)
+		self.allow_byes = byes
+		self.bye_points = bye_points
+		# id -> rounds où le joueur a été exempté
+		self.bye_rounds = {}
+		self.history = OpponentHistory()
+		self.rounds = RoundHistory(self.history)
+		self.tiebreakers = Tiebreakers()
+		self.standings = Standings()
+		self.round = 0
+		self.pairing_quality = None
+		self._design_labels = []
+		self._design_rounds = 0
 
 	def add_player(self, player):
+		player.attach(self.store)
+		self.history.ensure(player.id)
 		self.players.append(player)
+		self._players_by_id[player.id] = player
+		self.tiebreakers.add_player(player.id)
+		self.standings.add(player.id, self._standing_key(player))
 
-	def create_tables(self):
+	def get_player(self, player_id):
+		return self._players_by_id[player_id]
+
+	def get_table(self, table_id):
+		return self._tables_by_id[table_id]
+
+	def ranking(self):
+		"""Joueurs dans l'ordre du classement."""
+		return [self._players_by_id[pid] for pid in self.standings.ids()]
+
+	def _active_ranking(self):
+		return [p for p in self.ranking() if p.id not in self.dropped]
+
+	def score_groups(self):
+		"""[(score, [player_id])] dans l'ordre du classement."""
+		return self.store.score_groups(self.standings.ids())
+
+	def pairing_metrics(self):
+		"""Qualité des tables du round courant (re-matchs, écarts, places répétées)."""
+		return measure_tables(self.tables, self.history)
+
+	def rematch_pressures(self):
+		"""{score: "low" / "medium" / "high"} pour le prochain round, à jour après chaque résultat."""
+		return score_group_pressures(self._active_ranking(), self._table_sizes(), self.round)
+
+	def player_matches(self, player_id):
+		"""[{"round", "table", "position"}] des tables jouées par le joueur."""
+		return [
+			{"round": r, "table": table_id, "position": "1er" if place == 1 else f"{place}e"}
+			for r, table_id, place in self.rounds.player_matches(player_id)
+		]
+
+	def ranking_rows(self):
+		"""(rang, id, nom, évolution depuis le round précédent), dans l'ordre du classement."""
+		return [
+			(rank, pid, self._players_by_id[pid].name, self.standings.rank_change(pid))
+			for rank, pid in enumerate(self.standings.ids(), start=1)
+		]
+
+	def _standing_key(self, player):
+		return self._standing_key_of(player.id)
+
+	def _standing_key_of(self, player_id):
+		"""Clé de classement lue dans les colonnes du store et des départages."""
+		opponents, pods = self.tiebreakers.values(player_id)
+		return (-self.store.scores[player_id], -opponents, -pods, player_id)
+
+	def _update_standings(self, player_ids):
+		self.standings.update_many({pid: self._standing_key_of(pid) for pid in player_ids})
+
+	def create_tables(self, attempts=1, workers=None):
+	    """
+	    Crée des tables aléatoires pour un nouveau round.
+
+	    Si un plan sans re-match existe pour ce nombre de joueurs (designs.py),
+	    il est suivi tant qu'il a des rounds. Sinon, attempts > 1 : tire autant d'appariements indépendants sur un pool
+	    de `workers` processus et garde celui qui a le moins de re-matchs.
+	    """
 	    import random
 	    random.shuffle(self.players)
 
-	    n = len(self.players)
-	    if n in (0, 1, 2, 5):
-	        raise ValueError(f"Répartition impossible pour {n} joueur(s) sans table de 2 ou 5.")
-
-	    fours = n // 4
-	    rem = n % 4
-	    threes = 0
-
-	    if rem == 0:
-	        pass
-	    elif rem == 3:
-	        threes = 1
-	    elif rem == 2:
-	        # 4+2 -> 3+3 (donc on remplace 1 table de 4 par 2 tables de 3)
-	        if fours < 1:
-	            raise ValueError(f"Répartition impossible pour {n} joueur(s).")
-	        fours -= 1
-	        threes = 2
-	    elif rem == 1:
-	        # 4+4+1 -> 3+3+3 (donc on remplace 2 tables de 4 par 3 tables de 3)
-	        if fours < 2:
-	            raise ValueError(f"Répartition impossible pour {n} joueur(s).")
-	        fours -= 2
-	        threes = 3
-
-	    sizes = [4] * fours + [3] * threes
-	    # (optionnel) mélanger l'ordre des tailles pour éviter que les 3 soient toujours à la fin
-	    # random.shuffle(sizes)
-
-	    self.tables.clear()
-	    table_id = 1
-	    idx = 0
-	    for sz in sizes:
-	        group = self.players[idx:idx + sz]
-	        self.tables.append(Table(table_id, group))
-	        idx += sz
-	        table_id += 1
-
-	def create_tables_by_score(self):
+	    sizes = self._table_sizes()
+	    players, self.byes = self._split_byes(self.players, sum(sizes))
+
+	    design = self._design_round(sizes)
+	    if design is not None:
+	        groups = design
+	    elif attempts > 1:
+	        groups = best_random_pairing(players, sizes, self.history, attempts, workers)
+	    else:
+	        groups = []
+	        idx = 0
+	        for sz in sizes:
+	            groups.append(players[idx:idx + sz])
+	            idx += sz
+
+	    self.standings.close_round()
+	    self.round += 1
+	    self._set_tables(groups)
+	    self._award_byes(self.byes)
+	    self.pairing_quality = self.pairing_metrics()
+
+	def create_tables_by_score(self, time_budget=None):
 	    """
 	    Crée les tables pour un nouveau round
-	    en groupant les joueurs par score décroissant.
+	    en groupant les joueurs par score décroissant,
+	    sans reformer les tables déjà jouées quand c'est possible.
+
+	    time_budget : secondes accordées à la recherche locale
+	    pour améliorer l'appariement (aucune par défaut).
 	    """
-	    # 1) Trier par score (desc)
-	    players_sorted = sorted(self.players, key=lambda p: p.score, reverse=True)
-
-	    n = len(players_sorted)
-	    if n in (0, 1, 2, 5):
-	        raise ValueError(f"Répartition impossible pour {n} joueurs")
-
-	    # 2) Calcul des tailles (4 / 3)
-	    fours = n // 4
-	    rem = n % 4
-	    threes = 0
-
-	    if rem == 0:
-	        pass
-	    elif rem == 3:
-	        threes = 1
-	    elif rem == 2:
-	        if fours < 1:
-	            raise ValueError("Répartition impossible")
-	        fours -= 1
-	        threes = 2
-	    elif rem == 1:
-	        if fours < 2:
-	            raise ValueError("Répartition impossible")
-	        fours -= 2
-	        threes = 3
-
-	    sizes = [4] * fours + [3] * threes
-
-	    # 3) Création des tables
-	    self.tables.clear()
-	    idx = 0
-	    table_id = 1
-
-	    for size in sizes:
-	        group = players_sorted[idx:idx + size]
-	        self.tables.append(Table(table_id, group))
-	        idx += size
-	        table_id += 1
+	    # 1) Ordre du classement (score desc), déjà tenu à jour
+	    players_sorted = self._active_ranking()
+
+	    # 2) Calcul des tailles ; les byes vont aux joueurs qui en ont eu
+	    # le moins, en partant du bas du classement
+	    sizes = self._table_sizes()
+	    players, self.byes = self._split_byes(players_sorted, sum(sizes))
+
+	    # 3) Appariement en évitant les re-matchs
+	    groups = pair_by_score(players, sizes, self.history, self.round)
+
+	    if time_budget:
+	        groups, _ = PairingSearch(groups, self.history).run(time_budget)
+
+	    # 4) Création des tables
+	    self.standings.close_round()
+	    self.round += 1
+	    self._set_tables(groups)
+	    self._award_byes(self.byes)
+	    self.pairing_quality = self.pairing_metrics()
+
+	def _split_byes(self, players, seated):
+		"""
+		(joueurs assis, byes) : parmi les joueurs qui ont eu le moins de
+		byes, ceux placés le plus bas dans `players`. L'ordre est conservé.
+		"""
+		count = len(players) - seated
+		if count <= 0:
+			return list(players), []
+
+		order = sorted(
+			range(len(players)),
+			key=lambda i: (len(self.bye_rounds.get(players[i].id, ())), -i),
+		)
+		out = set(order[:count])
+		return (
+			[p for i, p in enumerate(players) if i not in out],
+			[p for i, p in enumerate(players) if i in out],
+		)
+
+	def _award_byes(self, players):
+		"""Un bye compte comme une victoire : bye_points, sans adversaire."""
+		changed = set()
+		for player in players:
+			self.bye_rounds.setdefault(player.id, []).append(self.round)
+			player.add_score(self.bye_points)
+			changed |= self.tiebreakers.add_points(player.id, self.bye_points)
+			changed.add(player.id)
+		self._update_standings(changed)
+
+	def _design_round(self, sizes):
+		"""
+		Tables du plan précalculé, si tous les rounds précédents en sortent
+		et que le roster n'a pas changé. Le premier mélange des joueurs
+		sert d'étiquetage pour tout le plan.
+		"""
+		if self.byes or any(size != DESIGN_TABLE_SIZE for size in sizes):
+			return None
+		if self.round != self._design_rounds:
+			return None
+
+		if self.round == 0:
+			self._design_labels = list(self.players)
+		elif set(self._design_labels) != set(self.players):
+			# Retrait / arrivée en cours de tournoi : le plan ne vaut plus
+			return None
+
+		pods = design_round(len(self.players), self.round)
+		if pods is None:
+			return None
+
+		self._design_rounds += 1
+		return [[self._design_labels[i] for i in pod] for pod in pods]
+
+	def _table_sizes(self):
+		return table_sizes(len(self.players), self.allowed_sizes, byes=self.allow_byes)
+
+	def start_pairing_search(self, time_budget=None, on_improve=None):
+		"""
+		Continue d'améliorer les tables du round en arrière-plan.
+		Le PairingSearch retourné s'annule avec cancel() ;
+		son meilleur état s'applique avec apply_pairing(search.best()[0]).
+		"""
+		search = PairingSearch([t.players for t in self.tables], self.history)
+		search.start(time_budget, on_improve)
+		return search
+
+	def apply_pairing(self, groups):
+		"""Remplace les tables du round courant, tant qu'aucun résultat n'est saisi."""
+		if any(t.result for t in self.tables):
+			raise ValueError("Des résultats ont déjà été saisis pour ce round.")
+		self._set_tables(groups)
+		self.pairing_quality = self.pairing_metrics()
+
+	def _set_tables(self, groups):
+		self.tables.clear()
+		self._tables_by_id.clear()
+		self._table_of.clear()
+		for table_id, group in enumerate(groups, start=1):
+			self._put_table(len(self.tables), Table(table_id, group))
+
+	def _put_table(self, position, table):
+		"""Place (ou remplace) la table à cette position de self.tables."""
+		if position < len(self.tables):
+			self.tables[position] = table
+		else:
+			self.tables.append(table)
+		self._tables_by_id[table.id] = table
+		for player in table.players:
+			self._table_of[player.id] = table.id
+
+	# =========================
+	# RÉPARATION DU ROUND EN COURS
+	# =========================
+
+	def drop_player(self, player_id):
+		"""
+		Retire un joueur pour la suite du tournoi (il reste au classement).
+		S'il est assis à une table sans résultat, seule cette table
+		et, si besoin, ses voisines sont réassises.
+		"""
+		if player_id in self.dropped:
+			return
+		player = self._players_by_id[player_id]
+
+		# Réparation d'abord : si elle échoue, rien n'a changé
+		table_id = self._table_of.get(player_id)
+		if table_id is not None and not self._tables_by_id[table_id].result:
+			self._repair(table_id, leaving=player)
+
+		self.dropped.add(player_id)
+		self.players.remove(player)
+		if player in self.byes:
+			self.byes.remove(player)
+		self._table_of.pop(player_id, None)
+
+	def add_late_player(self, player):
+		"""
+		Inscrit un joueur en cours de tournoi et l'assoit, pour le round
+		en cours, à la table de ses voisins de classement.
+		"""
+		self.add_player(player)
+		if not self.tables:
+			return
+
+		for pid in self.standings.around(player.id):
+			table_id = self._table_of.get(pid)
+			if table_id is not None and not self._tables_by_id[table_id].result:
+				self._repair(table_id, arriving=player)
+				return
+
+		self.byes.append(player)
+
+	def _repair(self, table_id, leaving=None, arriving=None):
+		"""
+		Réassoit la table table_id en s'étendant aux tables voisines
+		(voisines au classement) jusqu'à trouver une répartition valide.
+		Les autres tables et leurs numéros ne bougent pas.
+		Lève ValueError sans rien modifier si aucune répartition n'existe.
+		"""
+		position = bisect_left(self.tables, table_id, key=lambda t: t.id)
+		lo, hi = position, position + 1
+		byes = False
+
+		while True:
+			window = [t for t in self.tables[lo:hi] if not t.result]
+			players = [p for t in window for p in t.players if p is not leaving]
+			if arriving is not None:
+				players.append(arriving)
+
+			try:
+				sizes = table_sizes(len(players), self.allowed_sizes, byes=byes)
+				break
+			except ValueError:
+				if lo == 0 and hi == len(self.tables):
+					if byes or not self.allow_byes:
+						raise
+					byes = True
+				lo, hi = max(0, lo - 1), min(len(self.tables), hi + 1)
+
+		players.sort(key=self._standing_key)
+		players, extra = self._split_byes(players, sum(sizes))
+		for player in extra:
+			self._table_of.pop(player.id, None)
+			self.byes.append(player)
+		groups = pair_by_score(players, sizes, self.history, self.round - 1)
+
+		# Mêmes numéros de table ; une table en plus prend le numéro suivant
+		ids = [t.id for t in window]
+		next_id = max(t.id for t in self.tables) + 1
+		for table in window:
+			del self._tables_by_id[table.id]
+
+		positions = [i for i in range(lo, hi) if not self.tables[i].result]
+		for i, group in enumerate(groups):
+			if i < len(ids):
+				self._put_table(positions[i], Table(ids[i], group))
+			else:
+				self._put_table(len(self.tables), Table(next_id, group))
+				next_id += 1
+
+		for position in reversed(positions[len(groups):]):
+			del self.tables[position]
+
+		self._award_byes(extra)
+		self.pairing_quality = self.pairing_metrics()
 
 
 	def apply_result(self, table_id, result):
-		table = next(t for t in self.tables if t.id == table_id)
+		"""result = {player_id: points}"""
+		self._update_standings(self._record_result(self._tables_by_id[table_id], result))
+
+	def apply_results(self, batch):
+		"""
+		Applique les résultats de plusieurs tables en une fois.
+
+		batch : paires (table_id, {player_id: points}), ou un dict équivalent.
+		Tout le lot est validé avant d'appliquer quoi que ce soit :
+		en cas d'erreur, ValueError et aucun score n'est modifié.
+		"""
+		if isinstance(batch, dict):
+			batch = batch.items()
+
+		errors = []
+		checked = []
+		seen = set()
+
+		for table_id, result in batch:
+			table = self._tables_by_id.get(table_id)
+			if table is None:
+				errors.append(f"Table {table_id} inconnue.")
+				continue
+			if table_id in seen:
+				errors.append(f"Table {table_id} soumise deux fois.")
+				continue
+			if table.result:
+				errors.append(f"Table {table_id} a déjà un résultat.")
+				continue
+			seen.add(table_id)
+
+			seated = {p.id for p in table.players}
+			missing = seated - result.keys()
+			unknown = result.keys() - seated
+			if missing:
+				errors.append(f"Table {table_id} : joueur(s) sans résultat {sorted(missing)}.")
+			if unknown:
+				errors.append(f"Table {table_id} : joueur(s) inconnu(s) {sorted(unknown)}.")
+			invalid = sorted(
+				pid for pid, points in result.items()
+				if not isinstance(points, Real) or isinstance(points, bool)
+			)
+			if invalid:
+				errors.append(f"Table {table_id} : points invalides pour {invalid}.")
+
+			checked.append((table, result))
+
+		if errors:
+			raise ValueError("\n".join(errors))
+
+		# Un seul passage sur le classement pour tout le lot
+		changed = set()
+		for table, result in checked:
+			changed |= self._record_result(table, result)
+
+		self._update_standings(changed)
+
+	def _record_result(self, table, result):
+		"""Retourne les ids des joueurs dont la place au classement peut changer."""
+		# L'historique valide les points : rien n'est écrit s'il les refuse
+		ids = [p.id for p in table.players]
+		self.rounds.record_table(self.round, table.id, ids, [result[pid] for pid in ids])
 		table.set_result(result)
 
 		for player in table.players:
-			player.add_score(result[player.name])
\ No newline at end of file
+			player.add_score(result[player.id])
+			player.tables_played.append((self.round, table.id))
+
+		changed = self.tiebreakers.record_table(table.players, result)
+		changed.update(p.id for p in table.players)
+		return changed
\ No newline at end of file